@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
-import re
+import string
+from functools import lru_cache
 
+_KEY_CHARS = frozenset(string.ascii_letters + string.digits)
 
+
+def _clean_label(text: str) -> str:
+    """Skip leading whitespace and keep the rest of the first line, stripped."""
+    return text.lstrip().partition("\n")[0].strip()
+
+
+@lru_cache(maxsize=512)
 def parse_accelerator(label: str) -> tuple[str, str]:
     """Extract an accelerator key from a label.
 
@@ -15,22 +24,31 @@ def parse_accelerator(label: str) -> tuple[str, str]:
 
     Returns (key, clean_label). If no accelerator is found,
     returns ("", original_label).
+
+    Results are memoized, since menus re-render the same labels repeatedly.
     """
     label = label.strip()
+    if len(label) < 2:
+        return "", label
+
+    first = label[0]
 
     # Pattern: [K] label
-    m = re.match(r"^\[([a-zA-Z0-9])\]\s*(.*)", label)
-    if m:
-        return m.group(1), m.group(2).strip()
+    if first == "[":
+        if len(label) >= 3 and label[1] in _KEY_CHARS and label[2] == "]":
+            return label[1], _clean_label(label[3:])
+        return "", label
+
+    if first not in _KEY_CHARS:
+        return "", label
 
     # Pattern: K) label
-    m = re.match(r"^([a-zA-Z0-9])\)\s*(.*)", label)
-    if m:
-        return m.group(1), m.group(2).strip()
-
-    # Pattern: K - label
-    m = re.match(r"^([a-zA-Z0-9])\s*-\s+(.*)", label)
-    if m:
-        return m.group(1), m.group(2).strip()
+    if label[1] == ")":
+        return first, _clean_label(label[2:])
+
+    # Pattern: K - label (at least one whitespace character after the dash)
+    tail = label[1:].lstrip()
+    if len(tail) >= 2 and tail[0] == "-" and tail[1].isspace():
+        return first, _clean_label(tail[1:])
 
     return "", label
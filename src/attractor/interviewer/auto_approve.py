@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from attractor.model.question import Answer, AnswerValue, Question, QuestionType
 
+# Answer is frozen, so the fixed replies are shared rather than rebuilt per call.
+_YES = Answer(value=AnswerValue.YES, text="YES")
+_APPROVED = Answer(value="approved", text="approved")
+
 
 class AutoApproveInterviewer:
     """Interviewer that auto-approves without user interaction.
@@ -15,7 +19,7 @@ class AutoApproveInterviewer:
 
     def ask(self, question: Question) -> Answer:
         if question.type in (QuestionType.YES_NO, QuestionType.CONFIRMATION):
-            return Answer(value=AnswerValue.YES, text="YES")
+            return _YES
 
         if question.type == QuestionType.MULTIPLE_CHOICE and question.options:
             first = question.options[0]
@@ -26,4 +30,4 @@ class AutoApproveInterviewer:
             )
 
         # FREEFORM or MULTIPLE_CHOICE with no options
-        return Answer(value="approved", text="approved")
+        return _APPROVED
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import queue
 
-from attractor.model.question import Answer, Question
+from attractor.model.question import Answer, AnswerValue, Question
 
 
 class QueueInterviewer:
@@ -30,8 +30,6 @@ class QueueInterviewer:
         try:
             return self.answer_queue.get(timeout=self._timeout)
         except queue.Empty:
-            from attractor.model.question import AnswerValue
-
             return Answer(value=AnswerValue.TIMEOUT, text="")
 
     def respond(self, answer: Answer) -> None:
@@ -33,7 +33,7 @@ class RecordingInterviewer:
 
     def transcript(self) -> list[QAPair]:
         """Return the list of all recorded Q&A pairs."""
-        return list(self._records)
+        return self._records.copy()
 
     def clear(self) -> None:
         """Clear the recording history."""
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     """A single node in the pipeline graph."""
 
@@ -39,7 +39,7 @@ class Node:
         return self.label or self.id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edge:
     """A directed edge connecting two nodes."""
 
@@ -57,7 +57,7 @@ class Edge:
             raise ValueError("Edge must have non-empty from_node and to_node")
 
 
-@dataclass
+@dataclass(slots=True)
 class Graph:
     """The full pipeline graph containing nodes, edges, and metadata."""
 
@@ -25,7 +25,7 @@ class AnswerValue(Enum):
     TIMEOUT = "TIMEOUT"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Option:
     """A single selectable option for multiple-choice questions."""
 
@@ -33,7 +33,7 @@ class Option:
     label: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Question:
     """A question to be posed to the user during pipeline execution."""
 
@@ -46,7 +46,7 @@ class Question:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Answer:
     """The user's response to a Question."""
 
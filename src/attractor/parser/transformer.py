@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import copy
+import sys
+from itertools import pairwise
 from pathlib import Path
 
 from lark import Lark, Token, Transformer, Tree
@@ -43,6 +45,9 @@ _EDGE_FIELDS: dict[str, type] = {
     "loop_restart": bool,
 }
 
+# Seconds per single-character duration suffix ("ms" is handled separately).
+_DURATION_MULTIPLIERS: dict[str, float] = {"s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
 
 def _coerce(value: object, target: type) -> object:
     """Coerce a parsed value to the target type expected by the dataclass."""
@@ -75,13 +80,9 @@ def _build_node(node_id: str, attrs: dict[str, object]) -> Node:
     return Node(**kwargs)  # type: ignore[arg-type]
 
 
-def _build_edge(from_node: str, to_node: str, attrs: dict[str, object]) -> Edge:
-    """Build an Edge from endpoints and merged attribute dict."""
-    kwargs: dict[str, object] = {"from_node": from_node, "to_node": to_node}
-    for k, v in attrs.items():
-        if k in _EDGE_FIELDS:
-            kwargs[k] = _coerce(v, _EDGE_FIELDS[k])
-    return Edge(**kwargs)  # type: ignore[arg-type]
+def _edge_fields(attrs: dict[str, object]) -> dict[str, object]:
+    """Coerce a merged attribute dict into Edge keyword arguments (sans endpoints)."""
+    return {k: _coerce(v, _EDGE_FIELDS[k]) for k, v in attrs.items() if k in _EDGE_FIELDS}
 
 
 class _Sentinel:
@@ -131,12 +132,12 @@ class DotTransformer(Transformer):  # type: ignore[type-arg]
         return raw[1:-1].replace('\\"', '"').replace("\\n", "\n").replace("\\\\", "\\")
 
     def duration_value(self, items: list[Token]) -> float:
+        # The DURATION terminal guarantees digits followed by exactly one
+        # suffix, so "ms" is the only two-character case to check.
         raw = str(items[0])
-        multipliers = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
-        for suffix, mult in multipliers.items():
-            if raw.endswith(suffix):
-                return float(raw[: -len(suffix)]) * mult
-        return float(raw)  # pragma: no cover
+        if raw.endswith("ms"):
+            return float(raw[:-2]) * 0.001
+        return float(raw[:-1]) * _DURATION_MULTIPLIERS[raw[-1]]
 
     def boolean_value(self, items: list[Token]) -> bool:
         return str(items[0]) == "true"
@@ -152,8 +153,11 @@ class DotTransformer(Transformer):  # type: ignore[type-arg]
 
     # ---- structural ----
 
+    # Node ids and attribute keys recur across nodes, edges and graph.nodes
+    # lookups, so they are interned to share one string object per name.
+
     def key(self, items: list[Token]) -> str:
-        return ".".join(str(t) for t in items)
+        return sys.intern(".".join(str(t) for t in items))
 
     def attr(self, items: list[object]) -> tuple[str, object]:
         return (str(items[0]), items[1])
@@ -162,7 +166,7 @@ class DotTransformer(Transformer):  # type: ignore[type-arg]
         return dict(items)
 
     def node_id(self, items: list[Token]) -> str:
-        return str(items[0])
+        return sys.intern(str(items[0]))
 
     def node_stmt(self, items: list[object]) -> _NodeDecl:
         node_id = str(items[0])
@@ -264,9 +268,12 @@ def _process_statements(
             merged = dict(current_edge_defaults)
             merged.update(stmt.attrs)
             # Expand chained edges: A -> B -> C produces A->B and B->C.
-            for i in range(len(stmt.node_ids) - 1):
-                edge = _build_edge(stmt.node_ids[i], stmt.node_ids[i + 1], merged)
-                graph.edges.append(edge)
+            # Every edge in the chain shares the same coerced attributes.
+            fields = _edge_fields(merged)
+            graph.edges.extend(
+                Edge(from_node=src, to_node=dst, **fields)  # type: ignore[arg-type]
+                for src, dst in pairwise(stmt.node_ids)
+            )
             # Ensure implicitly-referenced nodes exist.
             for nid in stmt.node_ids:
                 if nid not in graph.nodes:
@@ -291,19 +298,37 @@ def _process_statements(
             )
 
 
+_parser: Lark | None = None
+
+
+def _get_parser() -> Lark:
+    """Return the shared DOT parser, building it on first use.
+
+    Building the parser compiles the grammar, the LALR tables and the
+    lexer patterns, including the ``%ignore`` rules that strip comments.
+    That work is independent of the input, so it is done once per process.
+
+    The stateless :class:`DotTransformer` is attached to the LALR parser, so
+    rule callbacks run as each rule is reduced and no parse tree is built.
+    """
+    global _parser
+    if _parser is None:
+        _parser = Lark(
+            GRAMMAR_PATH.read_text(),
+            parser="lalr",
+            start="start",
+            transformer=DotTransformer(),
+        )
+    return _parser
+
+
 def parse_dot(source: str) -> Graph:
     """Parse a DOT source string into a Graph model."""
-    parser = Lark(
-        GRAMMAR_PATH.read_text(),
-        parser="lalr",
-        start="start",
-    )
+    parser = _get_parser()
     try:
-        tree = parser.parse(source)
+        return parser.parse(source)  # type: ignore[return-value]
     except Exception as e:
         # Try to extract line/column from Lark exceptions.
         line = getattr(e, "line", None)
         column = getattr(e, "column", None)
         raise ParseError(str(e), line=line, column=column) from e
-    transformer = DotTransformer()
-    return transformer.transform(tree)
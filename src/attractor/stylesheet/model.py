@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Selector:
     """A CSS-like selector targeting nodes by universal, class, or id.
 
@@ -20,7 +20,7 @@ class Selector:
     specificity: int  # 0, 1, 2
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StyleRule:
     """A single rule pairing a selector with property declarations."""
 
@@ -28,8 +28,47 @@ class StyleRule:
     properties: dict[str, str]  # llm_model, llm_provider, reasoning_effort
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stylesheet:
     """A collection of style rules parsed from a model stylesheet."""
 
-    rules: list[StyleRule]
+    rules: tuple[StyleRule, ...]
+    # Rules bucketed by selector kind, built once so that matching a node is
+    # a few dict lookups instead of a scan over every rule.  Class buckets
+    # hold rule indices so source order survives a node with several classes.
+    _universal: list[StyleRule] = field(init=False, repr=False, compare=False)
+    _by_class: dict[str, list[int]] = field(init=False, repr=False, compare=False)
+    _by_id: dict[str, list[StyleRule]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        universal: list[StyleRule] = []
+        by_class: dict[str, list[int]] = {}
+        by_id: dict[str, list[StyleRule]] = {}
+        for index, rule in enumerate(self.rules):
+            kind = rule.selector.kind
+            if kind == "universal":
+                universal.append(rule)
+            elif kind == "class":
+                by_class.setdefault(rule.selector.value, []).append(index)
+            elif kind == "id":
+                by_id.setdefault(rule.selector.value, []).append(rule)
+        object.__setattr__(self, "_universal", universal)
+        object.__setattr__(self, "_by_class", by_class)
+        object.__setattr__(self, "_by_id", by_id)
+
+    def matching_rules(self, node_id: str, node_class: str) -> list[StyleRule]:
+        """Return the rules matching a node, lowest specificity first.
+
+        Within one specificity level rules keep their source order, so a later
+        rule overrides an earlier one when applied in sequence.
+        """
+        matched = list(self._universal)
+        if node_class and self._by_class:
+            indices: list[int] = []
+            for name in node_class.split():
+                indices.extend(self._by_class.get(name, ()))
+            if len(indices) > 1:
+                indices.sort()
+            matched.extend(self.rules[i] for i in indices)
+        matched.extend(self._by_id.get(node_id, ()))
+        return matched
@@ -9,6 +9,7 @@ Syntax example:
 from __future__ import annotations
 
 import re
+import sys
 
 from attractor.stylesheet.model import Selector, StyleRule, Stylesheet
 
@@ -42,11 +43,13 @@ def _parse_selector(raw: str) -> Selector:
     raw = raw.strip()
     if raw == "*":
         return Selector(kind="universal", value="*", specificity=0)
+    # Selector values become bucket keys that are looked up with node ids and
+    # classes, so they are interned like the ids produced by the DOT parser.
     if raw.startswith("."):
-        class_name = raw[1:]
+        class_name = sys.intern(raw[1:])
         return Selector(kind="class", value=class_name, specificity=1)
     if raw.startswith("#"):
-        node_id = raw[1:]
+        node_id = sys.intern(raw[1:])
         return Selector(kind="id", value=node_id, specificity=2)
     raise ValueError(f"Invalid selector: {raw!r}")
 
@@ -55,7 +58,7 @@ def _parse_properties(body: str) -> dict[str, str]:
     """Parse the body of a rule block into a property dictionary."""
     props: dict[str, str] = {}
     for match in _PROP_RE.finditer(body):
-        key = match.group("key").strip()
+        key = sys.intern(match.group("key").strip())
         value = match.group("value").strip()
         props[key] = value
     return props
@@ -66,10 +69,12 @@ def parse_stylesheet(source: str) -> Stylesheet:
 
     Returns a Stylesheet containing all parsed rules in source order.
     """
+    if not source or source.isspace():
+        return Stylesheet(rules=())
     rules: list[StyleRule] = []
     for match in _RULE_RE.finditer(source):
         selector = _parse_selector(match.group("selector"))
         properties = _parse_properties(match.group("body"))
         if properties:  # skip rules with no valid properties
             rules.append(StyleRule(selector=selector, properties=properties))
-    return Stylesheet(rules=rules)
+    return Stylesheet(rules=tuple(rules))
@@ -1,17 +1,36 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from attractor.model.graph import Graph
+from attractor.transforms.base import NodeTransform, Transform
+from attractor.transforms.rewrite import apply_node_transforms
 from attractor.transforms.variable_expansion import VariableExpansionTransform
 from attractor.transforms.stylesheet import StylesheetApplicationTransform
 
-BUILTIN_TRANSFORMS = [
+BUILTIN_TRANSFORMS: list[Transform] = [
     VariableExpansionTransform(),
     StylesheetApplicationTransform(),
 ]
 
 
-def apply_transforms(graph, custom_transforms=None):
-    """Apply all built-in transforms (and any custom ones) to *graph*."""
-    transforms = list(BUILTIN_TRANSFORMS)
-    if custom_transforms:
-        transforms.extend(custom_transforms)
-    for t in transforms:
+def apply_transforms(
+    graph: Graph, custom_transforms: Iterable[Transform] | None = None
+) -> Graph:
+    """Apply all built-in transforms (and any custom ones) to *graph*.
+
+    When every entry in ``BUILTIN_TRANSFORMS`` is a :class:`NodeTransform`
+    they share a single pass over the nodes; otherwise they run in order.
+    Transforms with nothing to do return their input unchanged, so a graph
+    that needs no rewriting passes through without being copied.
+    """
+    builtins = BUILTIN_TRANSFORMS
+    node_transforms = [t for t in builtins if isinstance(t, NodeTransform)]
+    if len(node_transforms) == len(builtins):
+        graph = apply_node_transforms(graph, node_transforms)
+    else:
+        for t in builtins:
+            graph = t.apply(graph)
+    for t in custom_transforms or ():
         graph = t.apply(graph)
     return graph
@@ -1,13 +1,35 @@
-"""Base protocol for graph transforms."""
+"""Base protocol and classes for graph transforms."""
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Any, Protocol
 
-from attractor.model.graph import Graph
+from attractor.model.graph import Graph, Node
+from attractor.transforms.rewrite import apply_node_transforms
 
 
 class Transform(Protocol):
     """A graph-to-graph transformation step."""
 
     def apply(self, graph: Graph) -> Graph: ...
+
+
+class NodeTransform:
+    """Base class for transforms that rewrite each node independently.
+
+    Subclassing is an explicit opt-in: node transforms in
+    ``BUILTIN_TRANSFORMS`` share a single pass over the nodes.  ``prepare``
+    reads the graph-level state the transform needs and returns None when
+    there is nothing to do; ``node_updates`` returns the field updates for a
+    single node.  Node transforms may only read graph state that node
+    rewrites leave untouched.
+    """
+
+    def prepare(self, graph: Graph) -> Any:
+        raise NotImplementedError
+
+    def node_updates(self, context: Any, node: Node) -> dict[str, Any]:
+        raise NotImplementedError
+
+    def apply(self, graph: Graph) -> Graph:
+        return apply_node_transforms(graph, (self,))
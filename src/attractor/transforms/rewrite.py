@@ -0,0 +1,46 @@
+"""Shared node-rewriting pass used by the built-in transforms."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from attractor.model.graph import Graph, Node
+
+if TYPE_CHECKING:
+    from attractor.transforms.base import NodeTransform
+
+
+def apply_node_transforms(graph: Graph, transforms: Iterable[NodeTransform]) -> Graph:
+    """Apply *transforms* in order, in a single walk over the graph's nodes.
+
+    Each transform sees the node as rewritten by the transforms before it,
+    so the result matches applying them one after another.  Only changed
+    nodes are rebuilt; the rest are shared with *graph*, as are its edges
+    and attributes.  If nothing changes, *graph* itself is returned.
+    """
+    active = [(t, ctx) for t in transforms if (ctx := t.prepare(graph)) is not None]
+    if not active:
+        return graph
+
+    changed: dict[str, Node] = {}
+    for nid, node in graph.nodes.items():
+        updated = node
+        for transform, context in active:
+            updates = transform.node_updates(context, updated)
+            if updates:
+                updated = replace(updated, **updates)
+        if updated is not node:
+            changed[nid] = updated
+
+    if not changed:
+        return graph
+    new_nodes = dict(graph.nodes)
+    new_nodes.update(changed)
+    return Graph(
+        name=graph.name,
+        nodes=new_nodes,
+        edges=graph.edges,
+        attributes=graph.attributes,
+    )
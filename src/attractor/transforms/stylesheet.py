@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import fields, replace
+from collections.abc import Callable
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any
 
 from attractor.model.graph import Graph, Node
+from attractor.stylesheet import Stylesheet, parse_stylesheet
+from attractor.transforms.base import NodeTransform
 
 
 # Node field names that can be set via stylesheet properties.
@@ -34,23 +39,38 @@ def _is_explicitly_set(node: Node, field_name: str) -> bool:
     return bool(value)
 
 
+@lru_cache(maxsize=128)
+def _parse_cached(source: str) -> Stylesheet:
+    """Parse *source* once; the frozen Stylesheet is shared between graphs."""
+    return parse_stylesheet(source)
+
+
+def _parse_bool(raw: str) -> bool:
+    return raw.lower() in ("true", "1", "yes")
+
+
+# Coercion for each non-string Node field, keyed by the field's annotation.
+# Resolved once here rather than by walking fields(Node) for every property.
+_COERCERS_BY_ANNOTATION: dict[str, Callable[[str], object]] = {
+    "int": int,
+    "float": float,
+    "float | None": float,
+    "bool": _parse_bool,
+}
+_FIELD_COERCERS: dict[str, Callable[[str], object]] = {
+    f.name: _COERCERS_BY_ANNOTATION[f.type]
+    for f in fields(Node)
+    if f.type in _COERCERS_BY_ANNOTATION
+}
+
+
 def _coerce_value(field_name: str, raw: str) -> object:
     """Coerce a stylesheet string value to the appropriate Python type."""
-    # Look up the type annotation from Node fields.
-    for f in fields(Node):
-        if f.name == field_name:
-            annotation = f.type
-            if annotation in ("int",):
-                return int(raw)
-            if annotation in ("float", "float | None"):
-                return float(raw)
-            if annotation in ("bool",):
-                return raw.lower() in ("true", "1", "yes")
-            return raw
-    return raw
-
-
-class StylesheetApplicationTransform:
+    coerce = _FIELD_COERCERS.get(field_name)
+    return coerce(raw) if coerce is not None else raw
+
+
+class StylesheetApplicationTransform(NodeTransform):
     """Apply the graph's ``model_stylesheet`` attribute to nodes.
 
     Selector matching:
@@ -62,57 +82,27 @@ class StylesheetApplicationTransform:
     that are already explicitly set on the node are never overridden.
     """
 
-    def apply(self, graph: Graph) -> Graph:
+    def prepare(self, graph: Graph) -> Stylesheet | None:
+        """Return the graph's parsed stylesheet, or None if it has no rules."""
         stylesheet_src = graph.attributes.get("model_stylesheet", "")
-        if not stylesheet_src:
-            return graph
-
-        from attractor.stylesheet import parse_stylesheet
-
-        stylesheet = parse_stylesheet(stylesheet_src)
-        if not stylesheet.rules:
-            return graph
-
-        # Sort rules by specificity ascending so lower-specificity rules
-        # are applied first and higher-specificity rules can override.
-        sorted_rules = sorted(stylesheet.rules, key=lambda r: r.selector.specificity)
-
-        new_nodes: dict[str, Node] = {}
-        for nid, node in graph.nodes.items():
-            updates: dict[str, object] = {}
-            for rule in sorted_rules:
-                if not self._matches(rule.selector, node):
-                    continue
-                for prop, value in rule.properties.items():
-                    if prop not in _NODE_FIELDS:
-                        continue
-                    # Only apply if the node doesn't already have this set explicitly.
-                    if _is_explicitly_set(node, prop):
-                        continue
-                    updates[prop] = _coerce_value(prop, value)
-
-            if updates:
-                new_nodes[nid] = replace(node, **updates)
-            else:
-                new_nodes[nid] = node
-
-        return Graph(
-            name=graph.name,
-            nodes=new_nodes,
-            edges=graph.edges,
-            attributes=graph.attributes,
-        )
-
-    @staticmethod
-    def _matches(selector: "object", node: Node) -> bool:
-        """Check whether *selector* matches *node*."""
-        kind = getattr(selector, "kind", "")
-        value = getattr(selector, "value", "")
-        if kind == "universal":
-            return True
-        if kind == "class":
-            # node_class can be a space-separated list of class names.
-            return value in node.node_class.split()
-        if kind == "id":
-            return node.id == value
-        return False
+        if not stylesheet_src or stylesheet_src.isspace():
+            return None
+        stylesheet = _parse_cached(stylesheet_src)
+        return stylesheet if stylesheet.rules else None
+
+    def node_updates(self, stylesheet: Stylesheet, node: Node) -> dict[str, Any]:
+        """Return the coerced field updates *stylesheet* makes to *node*."""
+        # Matching rules arrive in specificity order (universal < class < id),
+        # so overlaying them lets higher-specificity rules win.  Filtering and
+        # coercion then run once per surviving property.
+        merged: dict[str, str] = {}
+        for rule in stylesheet.matching_rules(node.id, node.node_class):
+            merged.update(rule.properties)
+        if not merged:
+            return {}
+        # Only apply properties the node doesn't already set explicitly.
+        return {
+            prop: _coerce_value(prop, value)
+            for prop, value in merged.items()
+            if prop in _NODE_FIELDS and not _is_explicitly_set(node, prop)
+        }
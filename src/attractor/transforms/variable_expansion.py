@@ -2,26 +2,19 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
+from typing import Any
 
-from attractor.model.graph import Graph
+from attractor.model.graph import Graph, Node
+from attractor.transforms.base import NodeTransform
 
 
-class VariableExpansionTransform:
+class VariableExpansionTransform(NodeTransform):
     """Replace ``$goal`` in every node's prompt with the graph-level goal string."""
 
-    def apply(self, graph: Graph) -> Graph:
-        if not graph.goal:
-            return graph
-        new_nodes = {}
-        for nid, node in graph.nodes.items():
-            if "$goal" in node.prompt:
-                new_nodes[nid] = replace(node, prompt=node.prompt.replace("$goal", graph.goal))
-            else:
-                new_nodes[nid] = node
-        return Graph(
-            name=graph.name,
-            nodes=new_nodes,
-            edges=graph.edges,
-            attributes=graph.attributes,
-        )
+    def prepare(self, graph: Graph) -> str | None:
+        return graph.goal or None
+
+    def node_updates(self, goal: str, node: Node) -> dict[str, Any]:
+        if "$goal" not in node.prompt:
+            return {}
+        return {"prompt": node.prompt.replace("$goal", goal)}
@@ -31,12 +31,8 @@ def parse_sse_lines(lines: Iterator[str]) -> Iterator[SSEEvent]:
     for raw_line in lines:
         line = raw_line.rstrip("\n").rstrip("\r")
 
-        # Comment
-        if line.startswith(":"):
-            continue
-
         # Blank line -> dispatch
-        if line == "":
+        if not line:
             if has_data:
                 current.data = "\n".join(data_parts)
                 yield current
@@ -45,15 +41,17 @@ def parse_sse_lines(lines: Iterator[str]) -> Iterator[SSEEvent]:
             has_data = False
             continue
 
-        # Parse field
-        if ":" in line:
-            field_name, _, value = line.partition(":")
-            # Strip at most one leading space per SSE spec
-            if value.startswith(" "):
-                value = value[1:]
-        else:
-            field_name = line
-            value = ""
+        # Parse field with a single scan; a line without a colon is a field
+        # name with an empty value.
+        field_name, _, value = line.partition(":")
+
+        # Comment
+        if not field_name:
+            continue
+
+        # Strip at most one leading space per SSE spec
+        if value.startswith(" "):
+            value = value[1:]
 
         if field_name == "event":
             current.event = value
@@ -35,6 +35,14 @@ from unified_llm.types.response import FinishReasonInfo, Response, Usage
 from unified_llm.types.streaming import StreamEvent
 from unified_llm.types.tools import ToolCall
 
+# Anthropic stop_reason -> FinishReason.  Unknown reasons map to OTHER.
+_FINISH_REASONS: dict[str, FinishReason] = {
+    "end_turn": FinishReason.STOP,
+    "stop_sequence": FinishReason.STOP,
+    "max_tokens": FinishReason.LENGTH,
+    "tool_use": FinishReason.TOOL_CALLS,
+}
+
 
 class AnthropicAdapter:
     """Adapter for the Anthropic Messages API."""
@@ -344,13 +352,7 @@ class AnthropicAdapter:
 
     def _map_finish_reason(self, raw: str) -> FinishReason:
         """Map Anthropic stop_reason to FinishReason."""
-        mapping = {
-            "end_turn": FinishReason.STOP,
-            "stop_sequence": FinishReason.STOP,
-            "max_tokens": FinishReason.LENGTH,
-            "tool_use": FinishReason.TOOL_CALLS,
-        }
-        return mapping.get(raw, FinishReason.OTHER)
+        return _FINISH_REASONS.get(raw, FinishReason.OTHER)
 
     # ------------------------------------------------------------------
     # Error handling
@@ -467,7 +469,40 @@ class AnthropicAdapter:
             except json.JSONDecodeError:
                 continue
 
-            if event_type == "message_start":
+            # Deltas make up nearly every event in a stream, so they are
+            # tested first.
+            if event_type == "content_block_delta":
+                delta = data.get("delta", {})
+                delta_type = delta.get("type", "")
+
+                if delta_type == "text_delta":
+                    yield StreamEvent(
+                        type=StreamEventType.TEXT_DELTA,
+                        delta=delta.get("text", ""),
+                        text_id=str(current_block_index),
+                        raw=data,
+                    )
+                elif delta_type == "input_json_delta":
+                    partial = delta.get("partial_json", "")
+                    tool_call_args_parts.append(partial)
+                    yield StreamEvent(
+                        type=StreamEventType.TOOL_CALL_DELTA,
+                        delta=partial,
+                        tool_call=ToolCall(
+                            id=tool_call_id,
+                            name=tool_call_name,
+                            raw_arguments=partial,
+                        ),
+                        raw=data,
+                    )
+                elif delta_type == "thinking_delta":
+                    yield StreamEvent(
+                        type=StreamEventType.REASONING_DELTA,
+                        reasoning_delta=delta.get("thinking", ""),
+                        raw=data,
+                    )
+
+            elif event_type == "message_start":
                 msg = data.get("message", {})
                 response_id = msg.get("id", "")
                 response_model = msg.get("model", "")
@@ -505,37 +540,6 @@ class AnthropicAdapter:
                         raw=data,
                     )
 
-            elif event_type == "content_block_delta":
-                delta = data.get("delta", {})
-                delta_type = delta.get("type", "")
-
-                if delta_type == "text_delta":
-                    yield StreamEvent(
-                        type=StreamEventType.TEXT_DELTA,
-                        delta=delta.get("text", ""),
-                        text_id=str(current_block_index),
-                        raw=data,
-                    )
-                elif delta_type == "input_json_delta":
-                    partial = delta.get("partial_json", "")
-                    tool_call_args_parts.append(partial)
-                    yield StreamEvent(
-                        type=StreamEventType.TOOL_CALL_DELTA,
-                        delta=partial,
-                        tool_call=ToolCall(
-                            id=tool_call_id,
-                            name=tool_call_name,
-                            raw_arguments=partial,
-                        ),
-                        raw=data,
-                    )
-                elif delta_type == "thinking_delta":
-                    yield StreamEvent(
-                        type=StreamEventType.REASONING_DELTA,
-                        reasoning_delta=delta.get("thinking", ""),
-                        raw=data,
-                    )
-
             elif event_type == "content_block_stop":
                 if current_block_type == "text":
                     yield StreamEvent(
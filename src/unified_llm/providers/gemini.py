@@ -30,6 +30,15 @@ from unified_llm.types.response import FinishReasonInfo, Response, Usage
 from unified_llm.types.streaming import StreamEvent
 from unified_llm.types.tools import ToolCall
 
+# Gemini finishReason -> FinishReason.  Unknown reasons map to OTHER.
+_FINISH_REASONS: dict[str, FinishReason] = {
+    "STOP": FinishReason.STOP,
+    "MAX_TOKENS": FinishReason.LENGTH,
+    "SAFETY": FinishReason.CONTENT_FILTER,
+    "RECITATION": FinishReason.CONTENT_FILTER,
+    "OTHER": FinishReason.OTHER,
+}
+
 
 class GeminiAdapter:
     """Adapter for the Google Gemini generativeLanguage API."""
@@ -310,14 +319,7 @@ class GeminiAdapter:
 
     def _map_finish_reason(self, raw: str) -> FinishReason:
         """Map Gemini finishReason to FinishReason."""
-        mapping = {
-            "STOP": FinishReason.STOP,
-            "MAX_TOKENS": FinishReason.LENGTH,
-            "SAFETY": FinishReason.CONTENT_FILTER,
-            "RECITATION": FinishReason.CONTENT_FILTER,
-            "OTHER": FinishReason.OTHER,
-        }
-        return mapping.get(raw, FinishReason.OTHER)
+        return _FINISH_REASONS.get(raw, FinishReason.OTHER)
 
     # ------------------------------------------------------------------
     # Error handling
@@ -11,7 +11,7 @@ from unified_llm.types.tools import ToolCall
 from unified_llm.types.response import FinishReasonInfo, Response, Usage
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamEvent:
     """A single event emitted during streaming."""
 
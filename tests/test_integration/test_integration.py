@@ -6,26 +6,40 @@ transform, build a handler registry, create an Engine, and run to completion.
 
 from __future__ import annotations
 
+import copy
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 from click.testing import CliRunner
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is a dev extra; fall back to the stdlib parser
+    _loads = json.loads
+
 from attractor.cli.main import cli
 from attractor.engine.engine import Engine, HandlerRegistry
+from attractor.events import types as evt
 from attractor.events.bus import EventBus
 from attractor.model.checkpoint import Checkpoint
 from attractor.model.context import Context
+from attractor.model.diagnostic import Diagnostic
 from attractor.model.graph import Graph, Node
 from attractor.model.outcome import Outcome, Status
 from attractor.parser import parse_dot
 from attractor.transforms import apply_transforms
-from attractor.validation import validate, validate_or_raise
+from attractor.validation import ValidationError, validate, validate_or_raise
 
 EXAMPLES = Path(__file__).parent.parent.parent / "examples"
 
+# Shared default outcome.  The engine never mutates handler outcomes, so a
+# single instance can be returned from every stub call.
+_SUCCESS = Outcome(status=Status.SUCCESS)
+
 
 # ---------------------------------------------------------------------------
 # Test helpers
@@ -36,7 +50,7 @@ class StubHandler:
     """Handler that always returns a configurable outcome (default: SUCCESS)."""
 
     def __init__(self, outcome: Outcome | None = None) -> None:
-        self.outcome = outcome or Outcome(status=Status.SUCCESS)
+        self.outcome = outcome if outcome is not None else _SUCCESS
         self.calls: list[str] = []
 
     def execute(
@@ -50,14 +64,15 @@ class PerNodeHandler:
     """Handler that returns different outcomes per node id."""
 
     def __init__(self, outcomes: dict[str, Outcome]) -> None:
-        self._outcomes = outcomes
+        self._outcomes = MappingProxyType(dict(outcomes))
+        self._get_outcome = self._outcomes.get
         self.calls: list[str] = []
 
     def execute(
         self, node: Node, context: Context, graph: Graph, logs_root: Path
     ) -> Outcome:
         self.calls.append(node.id)
-        return self._outcomes.get(node.id, Outcome(status=Status.SUCCESS))
+        return self._get_outcome(node.id, _SUCCESS)
 
 
 class SequenceHandler:
@@ -65,15 +80,17 @@ class SequenceHandler:
 
     def __init__(self, sequences: dict[str, list[Outcome]] | None = None) -> None:
         self._sequences: dict[str, list[Outcome]] = sequences or {}
+        self._get_sequence = self._sequences.get
         self.calls: list[str] = []
 
     def execute(
         self, node: Node, context: Context, graph: Graph, logs_root: Path
     ) -> Outcome:
         self.calls.append(node.id)
-        if node.id in self._sequences and self._sequences[node.id]:
-            return self._sequences[node.id].pop(0)
-        return Outcome(status=Status.SUCCESS)
+        sequence = self._get_sequence(node.id)
+        if sequence:
+            return sequence.pop(0)
+        return _SUCCESS
 
 
 class AutoApproveHandler:
@@ -89,10 +106,60 @@ class AutoApproveHandler:
         return Outcome(status=Status.SUCCESS, preferred_label="approve")
 
 
+def _parse_examples() -> Mapping[str, Graph]:
+    """Parse every example DOT file into a read-only mapping."""
+    return MappingProxyType({
+        name: parse_dot((EXAMPLES / name).read_text(encoding="utf-8"))
+        for name in ("hello_world.dot", "branching.dot", "code_review.dot")
+    })
+
+
+_EXAMPLES_CACHE = _parse_examples()
+
+
 def load_example(name: str) -> Graph:
-    """Load and parse an example DOT file."""
-    path = EXAMPLES / name
-    return parse_dot(path.read_text(encoding="utf-8"))
+    """Return a private copy of a pre-parsed example graph."""
+    return copy.deepcopy(_EXAMPLES_CACHE[name])
+
+
+@pytest.fixture(scope="session")
+def parsed_graphs() -> Mapping[str, Graph]:
+    """The shared pre-parsed example graphs.  Do not mutate."""
+    return _EXAMPLES_CACHE
+
+
+@pytest.fixture(scope="session")
+def example_diagnostics(parsed_graphs: Mapping[str, Graph]) -> Mapping[str, list[Diagnostic]]:
+    """``validate()`` output for each shared example graph, computed once."""
+    return MappingProxyType({name: validate(g) for name, g in parsed_graphs.items()})
+
+
+@pytest.fixture(scope="session")
+def prepared_graphs(
+    parsed_graphs: Mapping[str, Graph],
+    example_diagnostics: Mapping[str, list[Diagnostic]],
+) -> Mapping[str, Graph]:
+    """The shared example graphs, validated and transformed once.  Do not mutate."""
+    prepared: dict[str, Graph] = {}
+    for name, graph in parsed_graphs.items():
+        errors = [d for d in example_diagnostics[name] if d.is_error]
+        if errors:
+            raise ValidationError(errors)
+        prepared[name] = apply_transforms(graph)
+    return MappingProxyType(prepared)
+
+
+def _collect_by_type(bus: EventBus, *event_types: type) -> dict[type, list[Any]]:
+    """Subscribe a list per event type on *bus*; other events are never captured.
+
+    Each list's bound ``append`` is registered directly, so dispatch costs no
+    extra Python-level call per event.
+    """
+    buckets: dict[type, list[Any]] = {}
+    for event_type in event_types:
+        bucket = buckets[event_type] = []
+        bus.subscribe(event_type, bucket.append)
+    return buckets
 
 
 def make_registry(
@@ -123,7 +190,26 @@ def run_pipeline(
 ) -> tuple[Outcome, Engine]:
     """Full pipeline run helper: validate, transform, create engine, run."""
     validate_or_raise(graph)
-    graph = apply_transforms(graph)
+    return run_prepared(
+        apply_transforms(graph),
+        handler,
+        tmp_path,
+        auto_approve=auto_approve,
+        checkpoint=checkpoint,
+        type_handlers=type_handlers,
+    )
+
+
+def run_prepared(
+    graph: Graph,
+    handler: Any,
+    tmp_path: Path,
+    *,
+    auto_approve: bool = False,
+    checkpoint: Checkpoint | None = None,
+    type_handlers: dict[str, Any] | None = None,
+) -> tuple[Outcome, Engine]:
+    """Run an already validated and transformed graph to completion."""
     registry = make_registry(handler, auto_approve=auto_approve, type_handlers=type_handlers)
     context = Context()
     event_bus = EventBus()
@@ -144,40 +230,51 @@ def run_pipeline(
 # ---------------------------------------------------------------------------
 
 
+HelloWorldRun = tuple[Outcome, StubHandler, Path]
+
+
+@pytest.fixture(scope="session")
+def hello_world_run(
+    prepared_graphs: Mapping[str, Graph], tmp_path_factory: pytest.TempPathFactory
+) -> HelloWorldRun:
+    """Run hello_world.dot once per session: (outcome, handler, logs_root)."""
+    run_dir = tmp_path_factory.mktemp("hello_world")
+    handler = StubHandler()
+    outcome, _ = run_prepared(prepared_graphs["hello_world.dot"], handler, run_dir)
+    return outcome, handler, run_dir
+
+
+@pytest.fixture(scope="session")
+def hello_world_manifest(hello_world_run: HelloWorldRun) -> dict[str, Any]:
+    """The decoded manifest.json written by the shared hello_world run."""
+    _, _, run_dir = hello_world_run
+    return _loads((run_dir / "manifest.json").read_bytes())
+
+
 class TestHelloWorldPipeline:
-    def test_hello_world_runs_to_success(self, tmp_path: Path) -> None:
-        graph = load_example("hello_world.dot")
-        outcome, engine = run_pipeline(graph, StubHandler(), tmp_path)
+    def test_hello_world_runs_to_success(self, hello_world_run: HelloWorldRun) -> None:
+        outcome, _, _ = hello_world_run
         assert outcome.status == Status.SUCCESS
 
-    def test_hello_world_manifest_exists(self, tmp_path: Path) -> None:
-        graph = load_example("hello_world.dot")
-        run_pipeline(graph, StubHandler(), tmp_path)
-        manifest = tmp_path / "manifest.json"
-        assert manifest.exists()
-        data = json.loads(manifest.read_text())
-        assert data["name"] == "hello_world"
+    def test_hello_world_manifest_exists(
+        self, hello_world_run: HelloWorldRun, hello_world_manifest: dict[str, Any]
+    ) -> None:
+        _, _, run_dir = hello_world_run
+        assert (run_dir / "manifest.json").exists()
+        assert hello_world_manifest["name"] == "hello_world"
 
-    def test_hello_world_checkpoint_exists(self, tmp_path: Path) -> None:
-        graph = load_example("hello_world.dot")
-        run_pipeline(graph, StubHandler(), tmp_path)
-        checkpoint = tmp_path / "checkpoint.json"
-        assert checkpoint.exists()
+    def test_hello_world_checkpoint_exists(self, hello_world_run: HelloWorldRun) -> None:
+        _, _, run_dir = hello_world_run
+        assert (run_dir / "checkpoint.json").exists()
 
-    def test_hello_world_nodes_executed(self, tmp_path: Path) -> None:
-        handler = StubHandler()
-        graph = load_example("hello_world.dot")
-        run_pipeline(graph, handler, tmp_path)
+    def test_hello_world_nodes_executed(self, hello_world_run: HelloWorldRun) -> None:
+        _, handler, _ = hello_world_run
         # Start and greet should be executed (End is terminal, not executed)
         assert "Start" in handler.calls
         assert "greet" in handler.calls
 
-    def test_hello_world_goal_in_manifest(self, tmp_path: Path) -> None:
-        graph = load_example("hello_world.dot")
-        run_pipeline(graph, StubHandler(), tmp_path)
-        manifest = tmp_path / "manifest.json"
-        data = json.loads(manifest.read_text())
-        assert data["goal"] == "Say hello to the world"
+    def test_hello_world_goal_in_manifest(self, hello_world_manifest: dict[str, Any]) -> None:
+        assert hello_world_manifest["goal"] == "Say hello to the world"
 
 
 # ---------------------------------------------------------------------------
@@ -185,20 +282,31 @@ class TestHelloWorldPipeline:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def success_run(
+    prepared_graphs: Mapping[str, Graph], tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Outcome, StubHandler]:
+    # check returns SUCCESS -> should go to process_good
+    handler = StubHandler(Outcome(status=Status.SUCCESS))
+    outcome, _ = run_prepared(
+        prepared_graphs["branching.dot"], handler, tmp_path_factory.mktemp("br_s")
+    )
+    return outcome, handler
+
+
 class TestBranchingSuccessPath:
-    def test_success_path_reaches_process_good(self, tmp_path: Path) -> None:
-        graph = load_example("branching.dot")
-        # check returns SUCCESS -> should go to process_good
-        handler = StubHandler(Outcome(status=Status.SUCCESS))
-        outcome, engine = run_pipeline(graph, handler, tmp_path)
+    def test_success_path_reaches_process_good(
+        self, success_run: tuple[Outcome, StubHandler]
+    ) -> None:
+        outcome, handler = success_run
         assert outcome.status == Status.SUCCESS
         assert "process_good" in handler.calls
         assert "process_bad" not in handler.calls
 
-    def test_success_path_includes_merge(self, tmp_path: Path) -> None:
-        graph = load_example("branching.dot")
-        handler = StubHandler(Outcome(status=Status.SUCCESS))
-        run_pipeline(graph, handler, tmp_path)
+    def test_success_path_includes_merge(
+        self, success_run: tuple[Outcome, StubHandler]
+    ) -> None:
+        _, handler = success_run
         assert "merge" in handler.calls
 
 
@@ -207,24 +315,33 @@ class TestBranchingSuccessPath:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def fail_run(
+    prepared_graphs: Mapping[str, Graph], tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Outcome, PerNodeHandler]:
+    # check returns FAIL -> should go to process_bad
+    handler = PerNodeHandler({
+        "check": Outcome(status=Status.FAIL),
+    })
+    outcome, _ = run_prepared(
+        prepared_graphs["branching.dot"], handler, tmp_path_factory.mktemp("br_f")
+    )
+    return outcome, handler
+
+
 class TestBranchingFailPath:
-    def test_fail_path_reaches_process_bad(self, tmp_path: Path) -> None:
-        graph = load_example("branching.dot")
-        # check returns FAIL -> should go to process_bad
-        handler = PerNodeHandler({
-            "check": Outcome(status=Status.FAIL),
-        })
-        outcome, engine = run_pipeline(graph, handler, tmp_path)
+    def test_fail_path_reaches_process_bad(
+        self, fail_run: tuple[Outcome, PerNodeHandler]
+    ) -> None:
+        outcome, handler = fail_run
         assert outcome.status == Status.SUCCESS
         assert "process_bad" in handler.calls
         assert "process_good" not in handler.calls
 
-    def test_fail_path_includes_merge(self, tmp_path: Path) -> None:
-        graph = load_example("branching.dot")
-        handler = PerNodeHandler({
-            "check": Outcome(status=Status.FAIL),
-        })
-        run_pipeline(graph, handler, tmp_path)
+    def test_fail_path_includes_merge(
+        self, fail_run: tuple[Outcome, PerNodeHandler]
+    ) -> None:
+        _, handler = fail_run
         assert "merge" in handler.calls
 
 
@@ -233,36 +350,56 @@ class TestBranchingFailPath:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def approve_run(
+    prepared_graphs: Mapping[str, Graph], tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Outcome, StubHandler, AutoApproveHandler]:
+    handler = StubHandler(Outcome(status=Status.SUCCESS))
+    auto = AutoApproveHandler()
+    outcome, _ = run_prepared(
+        prepared_graphs["code_review.dot"],
+        handler,
+        tmp_path_factory.mktemp("cr_auto"),
+        type_handlers={"wait.human": auto},
+    )
+    return outcome, handler, auto
+
+
+@pytest.fixture(scope="module")
+def registry_approve_run(
+    prepared_graphs: Mapping[str, Graph], tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Outcome, StubHandler]:
+    # Same scenario, with the approver installed by make_registry(auto_approve=True).
+    handler = StubHandler(Outcome(status=Status.SUCCESS))
+    outcome, _ = run_prepared(
+        prepared_graphs["code_review.dot"],
+        handler,
+        tmp_path_factory.mktemp("cr_registry"),
+        auto_approve=True,
+    )
+    return outcome, handler
+
+
 class TestCodeReviewAutoApprove:
-    def test_auto_approve_completes(self, tmp_path: Path) -> None:
-        graph = load_example("code_review.dot")
-        handler = StubHandler(Outcome(status=Status.SUCCESS))
-        outcome, engine = run_pipeline(
-            graph, handler, tmp_path, auto_approve=True
-        )
+    def test_auto_approve_completes(
+        self, registry_approve_run: tuple[Outcome, StubHandler]
+    ) -> None:
+        outcome, _ = registry_approve_run
         assert outcome.status == Status.SUCCESS
 
-    def test_auto_approve_executes_analyze(self, tmp_path: Path) -> None:
-        graph = load_example("code_review.dot")
-        handler = StubHandler(Outcome(status=Status.SUCCESS))
-        auto = AutoApproveHandler()
-        outcome, engine = run_pipeline(
-            graph,
-            handler,
-            tmp_path,
-            type_handlers={"wait.human": auto},
-        )
+    def test_auto_approve_executes_analyze(
+        self, approve_run: tuple[Outcome, StubHandler, AutoApproveHandler]
+    ) -> None:
+        outcome, handler, auto = approve_run
         assert outcome.status == Status.SUCCESS
         assert "analyze" in handler.calls
         assert "review_gate" in auto.calls
 
-    def test_auto_approve_skips_fix_loop(self, tmp_path: Path) -> None:
+    def test_auto_approve_skips_fix_loop(
+        self, registry_approve_run: tuple[Outcome, StubHandler]
+    ) -> None:
         """With auto-approve (success), the pipeline should not enter fix loop."""
-        graph = load_example("code_review.dot")
-        handler = StubHandler(Outcome(status=Status.SUCCESS))
-        outcome, engine = run_pipeline(
-            graph, handler, tmp_path, auto_approve=True
-        )
+        _, handler = registry_approve_run
         assert "fix" not in handler.calls
 
 
@@ -302,20 +439,17 @@ class TestResumeFromCheckpoint:
         outcome2 = engine2.run()
         assert outcome2.status == Status.SUCCESS
 
-    def test_checkpoint_contains_completed_nodes(self, tmp_path: Path) -> None:
-        graph = load_example("hello_world.dot")
-        handler = StubHandler()
-        run_pipeline(graph, handler, tmp_path)
-        cp = Checkpoint.load(tmp_path / "checkpoint.json")
+    def test_checkpoint_contains_completed_nodes(self, hello_world_run: HelloWorldRun) -> None:
+        _, _, run_dir = hello_world_run
+        cp = Checkpoint.load(run_dir / "checkpoint.json")
         assert len(cp.completed_nodes) > 0
 
-    def test_checkpoint_round_trip(self, tmp_path: Path) -> None:
+    def test_checkpoint_round_trip(
+        self, hello_world_run: HelloWorldRun, tmp_path: Path
+    ) -> None:
         """Checkpoint can be saved and loaded without data loss."""
-        graph = load_example("hello_world.dot")
-        handler = StubHandler()
-        run_pipeline(graph, handler, tmp_path)
-        cp_path = tmp_path / "checkpoint.json"
-        cp = Checkpoint.load(cp_path)
+        _, _, run_dir = hello_world_run
+        cp = Checkpoint.load(run_dir / "checkpoint.json")
 
         # Save to new path and reload
         cp2_path = tmp_path / "checkpoint2.json"
@@ -333,21 +467,13 @@ class TestResumeFromCheckpoint:
 
 
 class TestValidateExamples:
-    def test_validate_hello_world(self) -> None:
-        graph = load_example("hello_world.dot")
-        diagnostics = validate(graph)
-        errors = [d for d in diagnostics if d.is_error]
-        assert len(errors) == 0
-
-    def test_validate_branching(self) -> None:
-        graph = load_example("branching.dot")
-        diagnostics = validate(graph)
-        errors = [d for d in diagnostics if d.is_error]
-        assert len(errors) == 0
-
-    def test_validate_code_review(self) -> None:
-        graph = load_example("code_review.dot")
-        diagnostics = validate(graph)
+    @pytest.mark.parametrize(
+        "name", ["hello_world.dot", "branching.dot", "code_review.dot"]
+    )
+    def test_validate_example(
+        self, name: str, example_diagnostics: Mapping[str, list[Diagnostic]]
+    ) -> None:
+        diagnostics = example_diagnostics[name]
         errors = [d for d in diagnostics if d.is_error]
         assert len(errors) == 0
 
@@ -582,24 +708,23 @@ class TestCLIVersion:
 
 
 class TestTransformIntegration:
-    def test_variable_expansion_in_prompt(self, tmp_path: Path) -> None:
+    def test_variable_expansion_in_prompt(self, prepared_graphs: Mapping[str, Graph]) -> None:
         """Variable expansion transform should expand $goal in prompts."""
-        graph = load_example("code_review.dot")
-        graph = apply_transforms(graph)
+        graph = prepared_graphs["code_review.dot"]
         # After transform, the analyze node's prompt should have the goal expanded
         analyze = graph.nodes.get("analyze")
         if analyze:
             # $goal should be expanded to the graph's goal
             assert "Review code changes for quality" in analyze.prompt or "$goal" in analyze.prompt
 
-    def test_transforms_preserve_graph_structure(self, tmp_path: Path) -> None:
+    def test_transforms_preserve_graph_structure(
+        self, parsed_graphs: Mapping[str, Graph], prepared_graphs: Mapping[str, Graph]
+    ) -> None:
         """Transforms should not change the number of nodes or edges."""
-        graph = load_example("hello_world.dot")
-        original_nodes = len(graph.nodes)
-        original_edges = len(graph.edges)
-        graph = apply_transforms(graph)
-        assert len(graph.nodes) == original_nodes
-        assert len(graph.edges) == original_edges
+        original = parsed_graphs["hello_world.dot"]
+        graph = prepared_graphs["hello_world.dot"]
+        assert len(graph.nodes) == len(original.nodes)
+        assert len(graph.edges) == len(original.edges)
 
 
 # ---------------------------------------------------------------------------
@@ -644,61 +769,32 @@ class TestContextPropagation:
 
 
 class TestEventIntegration:
-    def test_pipeline_started_event(self, tmp_path: Path) -> None:
-        from attractor.events import types as evt
-
+    def test_lifecycle_events(self, tmp_path: Path) -> None:
         graph = load_example("hello_world.dot")
         validate_or_raise(graph)
         graph = apply_transforms(graph)
         handler = StubHandler()
         registry = make_registry(handler)
         bus = EventBus()
-        collected: list[Any] = []
-        bus.on_all(collected.append)
+        buckets = _collect_by_type(
+            bus,
+            evt.PipelineStarted,
+            evt.PipelineCompleted,
+            evt.StageStarted,
+            evt.StageCompleted,
+        )
 
         engine = Engine(graph, registry, event_bus=bus, logs_root=tmp_path)
         engine.run()
 
-        started = [e for e in collected if isinstance(e, evt.PipelineStarted)]
+        started = buckets[evt.PipelineStarted]
         assert len(started) == 1
         assert started[0].graph_name == "hello_world"
 
-    def test_pipeline_completed_event(self, tmp_path: Path) -> None:
-        from attractor.events import types as evt
-
-        graph = load_example("hello_world.dot")
-        validate_or_raise(graph)
-        graph = apply_transforms(graph)
-        handler = StubHandler()
-        registry = make_registry(handler)
-        bus = EventBus()
-        collected: list[Any] = []
-        bus.on_all(collected.append)
-
-        engine = Engine(graph, registry, event_bus=bus, logs_root=tmp_path)
-        engine.run()
-
-        completed = [e for e in collected if isinstance(e, evt.PipelineCompleted)]
+        completed = buckets[evt.PipelineCompleted]
         assert len(completed) == 1
         assert completed[0].outcome.status == Status.SUCCESS
 
-    def test_stage_events_for_each_node(self, tmp_path: Path) -> None:
-        from attractor.events import types as evt
-
-        graph = load_example("hello_world.dot")
-        validate_or_raise(graph)
-        graph = apply_transforms(graph)
-        handler = StubHandler()
-        registry = make_registry(handler)
-        bus = EventBus()
-        collected: list[Any] = []
-        bus.on_all(collected.append)
-
-        engine = Engine(graph, registry, event_bus=bus, logs_root=tmp_path)
-        engine.run()
-
-        stage_started = [e for e in collected if isinstance(e, evt.StageStarted)]
-        stage_completed = [e for e in collected if isinstance(e, evt.StageCompleted)]
         # At least Start and greet (2 non-terminal nodes)
-        assert len(stage_started) >= 2
-        assert len(stage_completed) >= 2
+        assert len(buckets[evt.StageStarted]) >= 2
+        assert len(buckets[evt.StageCompleted]) >= 2
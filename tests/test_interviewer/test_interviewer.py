@@ -7,6 +7,11 @@ import threading
 
 import pytest
 
+from attractor.interviewer.accelerators import parse_accelerator
+from attractor.interviewer.auto_approve import AutoApproveInterviewer
+from attractor.interviewer.callback import CallbackInterviewer
+from attractor.interviewer.queue_interviewer import QueueInterviewer
+from attractor.interviewer.recording import RecordingInterviewer
 from attractor.model.question import Answer, AnswerValue, Option, Question, QuestionType
 
 
@@ -15,64 +20,58 @@ from attractor.model.question import Answer, AnswerValue, Option, Question, Ques
 # ===========================================================================
 
 
-class TestAutoApproveInterviewer:
-    def test_yes_no_returns_yes(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-
-        interviewer = AutoApproveInterviewer()
-        q = Question(text="Continue?", type=QuestionType.YES_NO)
-
-        answer = interviewer.ask(q)
-
-        assert answer.value is AnswerValue.YES
-        assert answer.text == "YES"
-
-    def test_confirmation_returns_yes(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-
-        interviewer = AutoApproveInterviewer()
-        q = Question(text="Are you sure?", type=QuestionType.CONFIRMATION)
-
-        answer = interviewer.ask(q)
-
-        assert answer.value is AnswerValue.YES
-
-    def test_multiple_choice_returns_first_option(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-
-        interviewer = AutoApproveInterviewer()
-        options = [
-            Option(key="1", label="Python"),
-            Option(key="2", label="Rust"),
-            Option(key="3", label="TypeScript"),
-        ]
-        q = Question(text="Choose language", type=QuestionType.MULTIPLE_CHOICE, options=options)
-
-        answer = interviewer.ask(q)
-
-        assert answer.selected_option is not None
-        assert answer.selected_option.label == "Python"
-        assert answer.text == "Python"
+_LANGUAGES = [
+    Option(key="1", label="Python"),
+    Option(key="2", label="Rust"),
+    Option(key="3", label="TypeScript"),
+]
 
-    def test_freeform_returns_approved(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
 
-        interviewer = AutoApproveInterviewer()
-        q = Question(text="Enter your name", type=QuestionType.FREEFORM)
+@pytest.fixture(scope="module")
+def auto_interviewer() -> AutoApproveInterviewer:
+    # AutoApproveInterviewer is stateless, so one instance serves every case.
+    return AutoApproveInterviewer()
 
-        answer = interviewer.ask(q)
-
-        assert answer.text == "approved"
-
-    def test_multiple_choice_no_options(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-
-        interviewer = AutoApproveInterviewer()
-        q = Question(text="Choose", type=QuestionType.MULTIPLE_CHOICE)
-
-        answer = interviewer.ask(q)
 
-        assert answer.text == "approved"
+class TestAutoApproveInterviewer:
+    @pytest.mark.parametrize(
+        ("question", "expected"),
+        [
+            pytest.param(
+                Question(text="Continue?", type=QuestionType.YES_NO),
+                Answer(value=AnswerValue.YES, text="YES"),
+                id="yes_no_returns_yes",
+            ),
+            pytest.param(
+                Question(text="Are you sure?", type=QuestionType.CONFIRMATION),
+                Answer(value=AnswerValue.YES, text="YES"),
+                id="confirmation_returns_yes",
+            ),
+            pytest.param(
+                Question(
+                    text="Choose language",
+                    type=QuestionType.MULTIPLE_CHOICE,
+                    options=_LANGUAGES,
+                ),
+                Answer(value="1", selected_option=_LANGUAGES[0], text="Python"),
+                id="multiple_choice_returns_first_option",
+            ),
+            pytest.param(
+                Question(text="Enter your name", type=QuestionType.FREEFORM),
+                Answer(value="approved", text="approved"),
+                id="freeform_returns_approved",
+            ),
+            pytest.param(
+                Question(text="Choose", type=QuestionType.MULTIPLE_CHOICE),
+                Answer(value="approved", text="approved"),
+                id="multiple_choice_no_options",
+            ),
+        ],
+    )
+    def test_auto_approve(
+        self, auto_interviewer: AutoApproveInterviewer, question: Question, expected: Answer
+    ) -> None:
+        assert auto_interviewer.ask(question) == expected
 
 
 # ===========================================================================
@@ -82,8 +81,6 @@ class TestAutoApproveInterviewer:
 
 class TestCallbackInterviewer:
     def test_delegates_to_callback(self) -> None:
-        from attractor.interviewer.callback import CallbackInterviewer
-
         def my_callback(question: Question) -> Answer:
             return Answer(value="custom", text=f"answer to: {question.text}")
 
@@ -95,8 +92,6 @@ class TestCallbackInterviewer:
         assert answer.text == "answer to: What color?"
 
     def test_callback_receives_full_question(self) -> None:
-        from attractor.interviewer.callback import CallbackInterviewer
-
         received: list[Question] = []
 
         def capture(question: Question) -> Answer:
@@ -127,8 +122,6 @@ class TestCallbackInterviewer:
 
 class TestQueueInterviewer:
     def test_exchanges_via_queues(self) -> None:
-        from attractor.interviewer.queue_interviewer import QueueInterviewer
-
         interviewer = QueueInterviewer()
         q = Question(text="Ready?", type=QuestionType.YES_NO)
 
@@ -149,8 +142,6 @@ class TestQueueInterviewer:
         assert answer.text == "YES"
 
     def test_timeout_returns_timeout_answer(self) -> None:
-        from attractor.interviewer.queue_interviewer import QueueInterviewer
-
         interviewer = QueueInterviewer(timeout=0.1)
         q = Question(text="Will timeout", type=QuestionType.FREEFORM)
 
@@ -159,8 +150,6 @@ class TestQueueInterviewer:
         assert answer.value is AnswerValue.TIMEOUT
 
     def test_respond_convenience(self) -> None:
-        from attractor.interviewer.queue_interviewer import QueueInterviewer
-
         interviewer = QueueInterviewer()
 
         # Pre-load an answer
@@ -172,8 +161,6 @@ class TestQueueInterviewer:
         assert answer.text == "preloaded"
 
     def test_pending_question_returns_none_on_empty(self) -> None:
-        from attractor.interviewer.queue_interviewer import QueueInterviewer
-
         interviewer = QueueInterviewer()
         result = interviewer.pending_question(timeout=0.05)
         assert result is None
@@ -186,9 +173,6 @@ class TestQueueInterviewer:
 
 class TestRecordingInterviewer:
     def test_records_transcript(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-        from attractor.interviewer.recording import RecordingInterviewer
-
         inner = AutoApproveInterviewer()
         recorder = RecordingInterviewer(inner)
 
@@ -205,9 +189,6 @@ class TestRecordingInterviewer:
         assert transcript[1].question.text == "Q2"
 
     def test_delegates_to_inner(self) -> None:
-        from attractor.interviewer.callback import CallbackInterviewer
-        from attractor.interviewer.recording import RecordingInterviewer
-
         def echo(q: Question) -> Answer:
             return Answer(text=q.text)
 
@@ -219,9 +200,6 @@ class TestRecordingInterviewer:
         assert answer.text == "Hello"
 
     def test_clear_empties_transcript(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-        from attractor.interviewer.recording import RecordingInterviewer
-
         recorder = RecordingInterviewer(AutoApproveInterviewer())
         recorder.ask(Question(text="Q1", type=QuestionType.YES_NO))
         assert len(recorder.transcript()) == 1
@@ -230,9 +208,6 @@ class TestRecordingInterviewer:
         assert len(recorder.transcript()) == 0
 
     def test_transcript_returns_copy(self) -> None:
-        from attractor.interviewer.auto_approve import AutoApproveInterviewer
-        from attractor.interviewer.recording import RecordingInterviewer
-
         recorder = RecordingInterviewer(AutoApproveInterviewer())
         recorder.ask(Question(text="Q1", type=QuestionType.YES_NO))
 
@@ -249,61 +224,55 @@ class TestRecordingInterviewer:
 
 class TestParseAccelerator:
     def test_bracket_pattern(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("[Y] Yes please")
         assert key == "Y"
         assert label == "Yes please"
 
     def test_paren_pattern(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("N) No thanks")
         assert key == "N"
         assert label == "No thanks"
 
     def test_dash_pattern(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("A - Accept")
         assert key == "A"
         assert label == "Accept"
 
     def test_no_accelerator(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("Plain label")
         assert key == ""
         assert label == "Plain label"
 
     def test_numeric_key(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("[1] First option")
         assert key == "1"
         assert label == "First option"
 
     def test_lowercase_bracket(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("[y] yes")
         assert key == "y"
         assert label == "yes"
 
     def test_strips_whitespace(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("  [X] Extra spaces  ")
         assert key == "X"
         assert label == "Extra spaces"
 
     def test_empty_string(self) -> None:
-        from attractor.interviewer.accelerators import parse_accelerator
-
         key, label = parse_accelerator("")
         assert key == ""
         assert label == ""
 
+    def test_dash_requires_trailing_space(self) -> None:
+        key, label = parse_accelerator("A -Accept")
+        assert key == ""
+        assert label == "A -Accept"
+
+    def test_non_ascii_key_not_accelerator(self) -> None:
+        key, label = parse_accelerator("[é] accent")
+        assert key == ""
+        assert label == "[é] accent"
+
 
 # ===========================================================================
 # Imports from __init__.py
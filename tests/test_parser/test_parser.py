@@ -1,5 +1,6 @@
 """Comprehensive tests for the DOT parser."""
 
+from functools import cache
 from pathlib import Path
 
 import pytest
@@ -9,14 +10,21 @@ from attractor.model.graph import Graph, Node, Edge
 
 FIXTURES = Path(__file__).parent.parent / "fixtures"
 
+# Source text of every fixture, read once at import.
+_FIXTURE_SRC: dict[str, str] = {
+    p.name: p.read_text(encoding="utf-8") for p in FIXTURES.glob("*.dot")
+}
+
 
 # ---------------------------------------------------------------------------
 # Fixture helpers
 # ---------------------------------------------------------------------------
 
 
+@cache
 def _load(name: str) -> Graph:
-    return parse_dot((FIXTURES / name).read_text())
+    """Parse a fixture file once; the returned graph is shared, so never mutate it."""
+    return parse_dot(_FIXTURE_SRC[name])
 
 
 # ---------------------------------------------------------------------------
@@ -438,6 +446,10 @@ class TestParseErrors:
             parse_dot("digraph { ??? }")
         assert str(exc_info.value) != ""
 
+    def test_invalid_attribute_value(self) -> None:
+        with pytest.raises(ParseError):
+            parse_dot("digraph X { a [timeout=soon] }")
+
 
 # ---------------------------------------------------------------------------
 # Multi-line attribute blocks
@@ -105,6 +105,27 @@ class TestSpecificity:
         assert sorted_rules[2].selector.kind == "id"
 
 
+class TestMatchingRules:
+    def test_buckets_in_specificity_order(self):
+        source = """
+        #review { reasoning_effort: high; }
+        .fast { llm_model: gpt-4o-mini; }
+        * { llm_model: gpt-4; }
+        """
+        ss = parse_stylesheet(source)
+        kinds = [r.selector.kind for r in ss.matching_rules("review", "fast")]
+        assert kinds == ["universal", "class", "id"]
+
+    def test_unmatched_selectors_skipped(self):
+        ss = parse_stylesheet(".fast { llm_model: a; } #review { llm_model: b; }")
+        assert ss.matching_rules("other", "slow") == []
+
+    def test_multiple_classes_keep_source_order(self):
+        ss = parse_stylesheet(".b { llm_model: first; } .a { llm_model: second; }")
+        rules = ss.matching_rules("n", "a b")
+        assert [r.properties["llm_model"] for r in rules] == ["first", "second"]
+
+
 # ---------------------------------------------------------------------------
 # Edge cases
 # ---------------------------------------------------------------------------
@@ -113,11 +134,11 @@ class TestSpecificity:
 class TestEmptyStylesheet:
     def test_empty_string(self):
         ss = parse_stylesheet("")
-        assert ss.rules == []
+        assert ss.rules == ()
 
     def test_whitespace_only(self):
         ss = parse_stylesheet("   \n\t  ")
-        assert ss.rules == []
+        assert ss.rules == ()
 
 
 class TestStylesheetDataclass:
@@ -3,9 +3,10 @@
 import pytest
 
 from attractor.model.graph import Edge, Graph, Node
-from attractor.transforms import apply_transforms
+import attractor.transforms as transforms_module
+from attractor.transforms import BUILTIN_TRANSFORMS, apply_transforms
 from attractor.transforms.variable_expansion import VariableExpansionTransform
-from attractor.transforms.stylesheet import StylesheetApplicationTransform
+from attractor.transforms.stylesheet import StylesheetApplicationTransform, _parse_cached
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +69,14 @@ class TestVariableExpansion:
         g = _graph_with_prompt("Just do the work", goal="something")
         result = VariableExpansionTransform().apply(g)
         assert result.nodes["work"].prompt == "Just do the work"
+        assert result is g  # nothing to expand, same object returned
+
+    def test_unchanged_nodes_shared(self):
+        g = _graph_with_prompt("Achieve $goal now", goal="world peace")
+        result = VariableExpansionTransform().apply(g)
+        assert list(result.nodes) == list(g.nodes)
+        assert result.nodes["start"] is g.nodes["start"]
+        assert result.edges is g.edges
 
     def test_multiple_occurrences(self):
         g = _graph_with_prompt("$goal is $goal", goal="fun")
@@ -145,6 +154,12 @@ class TestStylesheetApplication:
         result = StylesheetApplicationTransform().apply(g)
         assert result.nodes["a"].llm_model == "explicit-model"
 
+    def test_values_coerced_to_field_types(self):
+        css = "* { max_retries: 3; goal_gate: true; timeout: 1.5; }"
+        g = _graph_with_stylesheet(css, nodes={"a": Node(id="a")})
+        node = StylesheetApplicationTransform().apply(g).nodes["a"]
+        assert (node.max_retries, node.goal_gate, node.timeout) == (3, True, 1.5)
+
     def test_no_stylesheet_noop(self):
         g = Graph(
             name="T",
@@ -160,6 +175,21 @@ class TestStylesheetApplication:
         result = StylesheetApplicationTransform().apply(g)
         assert result is g  # same object returned
 
+    def test_whitespace_stylesheet_not_parsed(self):
+        _parse_cached.cache_clear()
+        g = _graph_with_stylesheet("  \n\t ")
+        assert StylesheetApplicationTransform().apply(g) is g
+        assert _parse_cached.cache_info().currsize == 0
+
+    def test_stylesheet_source_parsed_once(self):
+        css = "* { llm_model: cached-model; }"
+        _parse_cached.cache_clear()
+        for _ in range(3):
+            result = StylesheetApplicationTransform().apply(_graph_with_stylesheet(css))
+            assert result.nodes["work"].llm_model == "cached-model"
+        info = _parse_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
 
 # ---------------------------------------------------------------------------
 # apply_transforms pipeline
@@ -189,6 +219,52 @@ class TestApplyTransforms:
         assert result.nodes["work"].prompt == "build stuff"
         assert result.nodes["work"].llm_model == "sonnet"
 
+    @pytest.mark.parametrize(
+        "css",
+        [
+            "* { llm_model: sonnet; prompt: styled $goal; }",
+            ".code { llm_model: opus; } #work { reasoning_effort: low; }",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize("goal", ["ship it", ""])
+    def test_single_pass_matches_sequential(self, css, goal):
+        g = Graph(
+            name="T",
+            nodes={
+                "start": Node(id="start", shape="Mdiamond"),
+                "work": Node(id="work", prompt="Do $goal", node_class="code"),
+                "bare": Node(id="bare"),
+            },
+            attributes={"goal": goal, "model_stylesheet": css},
+        )
+        expected = g
+        for t in BUILTIN_TRANSFORMS:
+            expected = t.apply(expected)
+        assert apply_transforms(g) == expected
+
+    def test_noop_pipeline_returns_same_graph(self):
+        g = _graph_with_stylesheet(".missing { llm_model: sonnet; }")
+        assert apply_transforms(g) is g
+
+    def test_builtin_list_with_plain_transform_runs_in_order(self, monkeypatch):
+        class RenameGraph:
+            def apply(self, graph: Graph) -> Graph:
+                return Graph(
+                    name=graph.name + "_renamed",
+                    nodes=graph.nodes,
+                    edges=graph.edges,
+                    attributes=graph.attributes,
+                )
+
+        monkeypatch.setattr(
+            transforms_module, "BUILTIN_TRANSFORMS", [*BUILTIN_TRANSFORMS, RenameGraph()]
+        )
+        g = _graph_with_prompt("Do $goal", goal="ship it")
+        result = apply_transforms(g)
+        assert result.name == "T_renamed"
+        assert result.nodes["work"].prompt == "Do ship it"
+
     def test_custom_transforms_appended(self):
         class AddSuffix:
             def apply(self, graph: Graph) -> Graph:
@@ -0,0 +1,45 @@
+"""Shared helpers for the provider adapter tests."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+import httpx
+
+from unified_llm.types.enums import StreamEventType
+from unified_llm.types.streaming import StreamEvent
+
+AdapterT = TypeVar("AdapterT")
+
+
+def share_mock_client(
+    adapter: AdapterT, *, base_url: str, headers: dict[str, str]
+) -> Callable[..., AdapterT]:
+    """Move *adapter* onto a mock transport and return a ``make_adapter(handler)``.
+
+    One mock transport, client and adapter are shared by every test in a
+    module.  The returned function points the transport at the test's handler,
+    so client and adapter setup runs once per module instead of once per test.
+    The adapters keep no per-request state, so sharing one between tests is
+    safe.
+    """
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+    adapter._client.close()  # type: ignore[attr-defined]
+    adapter._client = httpx.Client(  # type: ignore[attr-defined]
+        transport=transport,
+        base_url=base_url,
+        headers=headers,
+        timeout=httpx.Timeout(120.0),
+    )
+
+    def make_adapter(handler) -> AdapterT:
+        """Return the shared adapter, wired to *handler* via the mock transport."""
+        transport.handler = handler
+        return adapter
+
+    return make_adapter
+
+
+def first_of(events: Iterable[StreamEvent], event_type: StreamEventType) -> StreamEvent:
+    """Return the first event of *event_type*, leaving the rest of the stream unread."""
+    return next(e for e in events if e.type == event_type)
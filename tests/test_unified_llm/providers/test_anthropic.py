@@ -2,11 +2,20 @@
 from __future__ import annotations
 
 import json
+from collections import defaultdict
+from collections.abc import Iterator
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 import pytest
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is a dev extra; fall back to the stdlib parser
+    _loads = json.loads
+
+from tests.test_unified_llm.providers.conftest import first_of, share_mock_client
 from unified_llm.errors import (
     AuthenticationError,
     InvalidRequestError,
@@ -36,25 +45,19 @@ from unified_llm.types.response import FinishReasonInfo, Response, Usage
 from unified_llm.types.streaming import StreamEvent
 from unified_llm.types.tools import Tool, ToolCall, ToolChoice
 
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_adapter(handler) -> AnthropicAdapter:
-    """Create an adapter wired to a mock transport."""
-    adapter = AnthropicAdapter(api_key="test-key")
-    adapter._client = httpx.Client(
-        transport=httpx.MockTransport(handler),
-        base_url="https://api.anthropic.com",
-        headers={
-            "x-api-key": "test-key",
-            "anthropic-version": "2023-06-01",
-            "content-type": "application/json",
-        },
-        timeout=httpx.Timeout(120.0),
-    )
-    return adapter
+_make_adapter = share_mock_client(
+    AnthropicAdapter(api_key="test-key"),
+    base_url="https://api.anthropic.com",
+    headers={
+        "x-api-key": "test-key",
+        "anthropic-version": "2023-06-01",
+        "content-type": "application/json",
+    },
+)
 
 
 def _simple_response(**overrides: Any) -> dict[str, Any]:
@@ -71,14 +74,41 @@ def _simple_response(**overrides: Any) -> dict[str, Any]:
     return base
 
 
+# The unmodified default payload, serialized once and reused as raw bytes.
+_DEFAULT_RESPONSE_BODY = json.dumps(_simple_response()).encode()
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Requests are frozen, so the plain one-message request is built once.
+_REQ_HI = Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
+
+# The cache_control marker the adapter injects on system and user blocks.
+_EPHEMERAL = MappingProxyType({"type": "ephemeral"})
+
+
 def _sse_lines(events: list[tuple[str, dict[str, Any]]]) -> str:
     """Build SSE text from a list of (event_type, data) tuples."""
-    lines: list[str] = []
-    for event_type, data in events:
-        lines.append(f"event: {event_type}")
-        lines.append(f"data: {json.dumps(data)}")
-        lines.append("")
-    return "\n".join(lines)
+    return "".join(
+        f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+        for event_type, data in events
+    )
+
+
+class _ChunkedBytes(httpx.SyncByteStream):
+    """Response body delivered in the given chunks, as a real stream would be."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self._chunks = chunks
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._chunks
+
+
+def _collect(events: list[StreamEvent]) -> defaultdict[StreamEventType, list[StreamEvent]]:
+    """Group stream events by type in a single pass, preserving order."""
+    grouped: defaultdict[StreamEventType, list[StreamEvent]] = defaultdict(list)
+    for event in events:
+        grouped[event.type].append(event)
+    return grouped
 
 
 # ===========================================================================
@@ -94,8 +124,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -111,7 +141,7 @@ class TestAnthropicRequestTranslation:
         assert "system" in body
         assert body["system"][0]["text"] == "You are helpful."
         # Verify system block has cache_control
-        assert body["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert body["system"][-1]["cache_control"] == _EPHEMERAL
         # System messages should not appear in messages
         for msg in body["messages"]:
             assert msg["role"] != "system"
@@ -121,8 +151,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -145,8 +175,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -171,8 +201,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -182,15 +212,15 @@ class TestAnthropicRequestTranslation:
         adapter.complete(req)
 
         content = captured["body"]["messages"][0]["content"]
-        assert content[0] == {"type": "text", "text": "Hello", "cache_control": {"type": "ephemeral"}}
+        assert content[0] == {"type": "text", "text": "Hello", "cache_control": _EPHEMERAL}
 
     def test_image_url_content_translation(self):
         """IMAGE content with URL should translate to image URL block."""
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -205,18 +235,19 @@ class TestAnthropicRequestTranslation:
         adapter.complete(req)
 
         content = captured["body"]["messages"][0]["content"]
-        img_block = content[0]
-        assert img_block["type"] == "image"
-        assert img_block["source"]["type"] == "url"
-        assert img_block["source"]["url"] == "https://example.com/img.png"
+        assert content[0] == {
+            "type": "image",
+            "source": {"type": "url", "url": "https://example.com/img.png"},
+            "cache_control": _EPHEMERAL,
+        }
 
     def test_image_base64_content_translation(self):
         """IMAGE content with base64 data should translate to base64 block."""
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -235,18 +266,19 @@ class TestAnthropicRequestTranslation:
         adapter.complete(req)
 
         content = captured["body"]["messages"][0]["content"]
-        img_block = content[0]
-        assert img_block["type"] == "image"
-        assert img_block["source"]["type"] == "base64"
-        assert img_block["source"]["media_type"] == "image/png"
+        assert content[0] == {
+            "type": "image",
+            "source": {"type": "base64", "media_type": "image/png", "data": "ZmFrZWRhdGE="},
+            "cache_control": _EPHEMERAL,
+        }
 
     def test_tool_call_content_translation(self):
         """TOOL_CALL content should translate to tool_use blocks."""
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -264,22 +296,26 @@ class TestAnthropicRequestTranslation:
         adapter.complete(req)
 
         body = captured["body"]
-        # Find assistant message
-        assistant_msg = [m for m in body["messages"] if m["role"] == "assistant"][0]
-        tool_use_block = [
+        # Messages are [user, assistant, user(tool_result)].
+        assistant_msg = body["messages"][1]
+        assert assistant_msg["role"] == "assistant"
+        tool_use_block = next(
             b for b in assistant_msg["content"] if b.get("type") == "tool_use"
-        ][0]
-        assert tool_use_block["id"] == "tc_1"
-        assert tool_use_block["name"] == "get_weather"
-        assert tool_use_block["input"] == {"city": "NYC"}
+        )
+        assert tool_use_block == {
+            "type": "tool_use",
+            "id": "tc_1",
+            "name": "get_weather",
+            "input": {"city": "NYC"},
+        }
 
     def test_tool_definition_format(self):
         """Tools should be formatted with name, description, input_schema."""
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         tool = Tool(
@@ -300,63 +336,42 @@ class TestAnthropicRequestTranslation:
         assert tools[0]["description"] == "Search the web"
         assert tools[0]["input_schema"] == tool.parameters
 
-    def test_tool_choice_auto(self):
-        captured: dict[str, Any] = {}
-
-        def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
-
-        adapter = _make_adapter(handler)
-        req = Request(
-            model="claude-opus-4-6",
-            messages=(Message.user("Hi"),),
-            tools=(Tool(name="t", description="d"),),
-            tool_choice=ToolChoice(mode=ToolChoiceMode.AUTO),
-        )
-        adapter.complete(req)
-        assert captured["body"]["tool_choice"] == {"type": "auto"}
-
-    def test_tool_choice_required(self):
-        captured: dict[str, Any] = {}
-
-        def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
-
-        adapter = _make_adapter(handler)
-        req = Request(
-            model="claude-opus-4-6",
-            messages=(Message.user("Hi"),),
-            tools=(Tool(name="t", description="d"),),
-            tool_choice=ToolChoice(mode=ToolChoiceMode.REQUIRED),
-        )
-        adapter.complete(req)
-        assert captured["body"]["tool_choice"] == {"type": "any"}
-
-    def test_tool_choice_named(self):
+    @pytest.mark.parametrize(
+        "choice, tool_name, expected",
+        [
+            (ToolChoice(mode=ToolChoiceMode.AUTO), "t", {"type": "auto"}),
+            (ToolChoice(mode=ToolChoiceMode.REQUIRED), "t", {"type": "any"}),
+            (
+                ToolChoice(mode=ToolChoiceMode.NAMED, tool_name="search"),
+                "search",
+                {"type": "tool", "name": "search"},
+            ),
+        ],
+        ids=["auto", "required", "named"],
+    )
+    def test_tool_choice(self, choice, tool_name, expected):
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
             model="claude-opus-4-6",
             messages=(Message.user("Hi"),),
-            tools=(Tool(name="search", description="d"),),
-            tool_choice=ToolChoice(mode=ToolChoiceMode.NAMED, tool_name="search"),
+            tools=(Tool(name=tool_name, description="d"),),
+            tool_choice=choice,
         )
         adapter.complete(req)
-        assert captured["body"]["tool_choice"] == {"type": "tool", "name": "search"}
+        assert captured["body"]["tool_choice"] == expected
 
     def test_tool_choice_none_omits_tools(self):
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -374,23 +389,19 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
-        req = Request(
-            model="claude-opus-4-6",
-            messages=(Message.user("Hi"),),
-        )
-        adapter.complete(req)
+        adapter.complete(_REQ_HI)
         assert captured["body"]["max_tokens"] == 4096
 
     def test_max_tokens_explicit(self):
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -406,8 +417,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -421,18 +432,19 @@ class TestAnthropicRequestTranslation:
 
         body = captured["body"]
         # Last system block
-        assert body["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert body["system"][-1]["cache_control"] == _EPHEMERAL
         # Last user message's last content block
-        last_user_msg = [m for m in body["messages"] if m["role"] == "user"][-1]
-        assert last_user_msg["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        last_user_msg = body["messages"][-1]
+        assert last_user_msg["role"] == "user"
+        assert last_user_msg["content"][-1]["cache_control"] == _EPHEMERAL
 
     def test_beta_headers(self):
         """Beta headers from provider_options should be passed as anthropic-beta header."""
-        captured_headers: dict[str, str] = {}
+        captured: dict[str, str | None] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured_headers.update(dict(request.headers))
-            return httpx.Response(200, json=_simple_response())
+            captured["beta"] = request.headers.get("anthropic-beta")
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -443,16 +455,16 @@ class TestAnthropicRequestTranslation:
             },
         )
         adapter.complete(req)
-        assert "anthropic-beta" in captured_headers
-        assert "extended-thinking-2025-01-24" in captured_headers["anthropic-beta"]
+        assert captured["beta"] is not None
+        assert "extended-thinking-2025-01-24" in captured["beta"]
 
     def test_provider_options_merged(self):
         """Provider options under 'anthropic' key should be merged into body."""
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -475,8 +487,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -503,8 +515,8 @@ class TestAnthropicRequestTranslation:
         captured: dict[str, Any] = {}
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
-            return httpx.Response(200, json=_simple_response())
+            captured["body"] = _loads(request.content)
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
         req = Request(
@@ -524,10 +536,11 @@ class TestAnthropicRequestTranslation:
         adapter.complete(req)
 
         body = captured["body"]
-        assistant_msg = [m for m in body["messages"] if m["role"] == "assistant"][0]
-        thinking_block = [
+        assistant_msg = body["messages"][1]
+        assert assistant_msg["role"] == "assistant"
+        thinking_block = next(
             b for b in assistant_msg["content"] if b.get("type") == "thinking"
-        ][0]
+        )
         assert thinking_block["thinking"] == "My reasoning"
         assert thinking_block["signature"] == "sig123"
 
@@ -541,11 +554,10 @@ class TestAnthropicResponseParsing:
 
     def test_simple_text_response(self):
         def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=_simple_response())
+            return httpx.Response(200, content=_DEFAULT_RESPONSE_BODY, headers=_JSON_HEADERS)
 
         adapter = _make_adapter(handler)
-        req = Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        response = adapter.complete(req)
+        response = adapter.complete(_REQ_HI)
 
         assert response.text == "Hello!"
         assert response.finish_reason.reason == FinishReason.STOP
@@ -635,8 +647,7 @@ class TestAnthropicResponseParsing:
             return httpx.Response(200, json=raw)
 
         adapter = _make_adapter(handler)
-        req = Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        response = adapter.complete(req)
+        response = adapter.complete(_REQ_HI)
 
         assert response.usage.input_tokens == 100
         assert response.usage.output_tokens == 50
@@ -644,57 +655,32 @@ class TestAnthropicResponseParsing:
         assert response.usage.cache_read_tokens == 20
         assert response.usage.cache_write_tokens == 10
 
-    def test_finish_reason_end_turn(self):
-        raw = _simple_response(stop_reason="end_turn")
-
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=raw)
-
-        adapter = _make_adapter(handler)
-        response = adapter.complete(
-            Request(model="m", messages=(Message.user("Hi"),))
-        )
-        assert response.finish_reason.reason == FinishReason.STOP
-        assert response.finish_reason.raw == "end_turn"
-
-    def test_finish_reason_max_tokens(self):
-        raw = _simple_response(stop_reason="max_tokens")
-
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=raw)
-
-        adapter = _make_adapter(handler)
-        response = adapter.complete(
-            Request(model="m", messages=(Message.user("Hi"),))
-        )
-        assert response.finish_reason.reason == FinishReason.LENGTH
-
-    def test_finish_reason_stop_sequence(self):
-        raw = _simple_response(stop_reason="stop_sequence")
-
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(200, json=raw)
-
-        adapter = _make_adapter(handler)
-        response = adapter.complete(
-            Request(model="m", messages=(Message.user("Hi"),))
-        )
-        assert response.finish_reason.reason == FinishReason.STOP
-
-    def test_finish_reason_tool_use(self):
-        raw = _simple_response(
-            stop_reason="tool_use",
-            content=[{"type": "tool_use", "id": "t1", "name": "f", "input": {}}],
-        )
+    @pytest.mark.parametrize(
+        "stop_reason, expected, content",
+        [
+            ("end_turn", FinishReason.STOP, None),
+            ("max_tokens", FinishReason.LENGTH, None),
+            ("stop_sequence", FinishReason.STOP, None),
+            (
+                "tool_use",
+                FinishReason.TOOL_CALLS,
+                [{"type": "tool_use", "id": "t1", "name": "f", "input": {}}],
+            ),
+        ],
+    )
+    def test_finish_reason(self, stop_reason, expected, content):
+        overrides: dict[str, Any] = {"stop_reason": stop_reason}
+        if content is not None:
+            overrides["content"] = content
+        raw = _simple_response(**overrides)
 
         def handler(request: httpx.Request) -> httpx.Response:
             return httpx.Response(200, json=raw)
 
         adapter = _make_adapter(handler)
-        response = adapter.complete(
-            Request(model="m", messages=(Message.user("Hi"),))
-        )
-        assert response.finish_reason.reason == FinishReason.TOOL_CALLS
+        response = adapter.complete(_REQ_HI)
+        assert response.finish_reason.reason == expected
+        assert response.finish_reason.raw == stop_reason
 
     def test_mixed_content_response(self):
         """Response with text and tool_use blocks."""
@@ -724,66 +710,34 @@ class TestAnthropicResponseParsing:
 
 class TestAnthropicErrorHandling:
 
-    def test_401_authentication_error(self):
+    @pytest.mark.parametrize(
+        "status, error_type, error_cls, retryable, headers, retry_after",
+        [
+            (401, "authentication_error", AuthenticationError, False, {}, None),
+            (429, "rate_limit_error", RateLimitError, True, {"retry-after": "30"}, 30.0),
+            (500, "api_error", ServerError, True, {}, None),
+            (400, "invalid_request_error", InvalidRequestError, False, {}, None),
+            (404, "not_found_error", NotFoundError, False, {}, None),
+        ],
+        ids=["auth", "rate_limit", "server", "invalid_request", "not_found"],
+    )
+    def test_status_error_mapping(
+        self, status, error_type, error_cls, retryable, headers, retry_after
+    ):
         def handler(request: httpx.Request) -> httpx.Response:
             return httpx.Response(
-                401,
-                json={"type": "error", "error": {"type": "authentication_error", "message": "Invalid API key"}},
+                status,
+                json={"type": "error", "error": {"type": error_type, "message": "Failed"}},
+                headers=headers,
             )
 
         adapter = _make_adapter(handler)
-        with pytest.raises(AuthenticationError) as exc_info:
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
-        assert exc_info.value.status_code == 401
+        with pytest.raises(error_cls) as exc_info:
+            adapter.complete(_REQ_HI)
+        assert exc_info.value.status_code == status
         assert exc_info.value.provider == "anthropic"
-
-    def test_429_rate_limit_error(self):
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(
-                429,
-                json={"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limit exceeded"}},
-                headers={"retry-after": "30"},
-            )
-
-        adapter = _make_adapter(handler)
-        with pytest.raises(RateLimitError) as exc_info:
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
-        assert exc_info.value.retryable is True
-        assert exc_info.value.retry_after == 30.0
-
-    def test_500_server_error(self):
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(
-                500,
-                json={"type": "error", "error": {"type": "api_error", "message": "Internal server error"}},
-            )
-
-        adapter = _make_adapter(handler)
-        with pytest.raises(ServerError) as exc_info:
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
-        assert exc_info.value.retryable is True
-
-    def test_400_invalid_request_error(self):
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(
-                400,
-                json={"type": "error", "error": {"type": "invalid_request_error", "message": "Bad request"}},
-            )
-
-        adapter = _make_adapter(handler)
-        with pytest.raises(InvalidRequestError):
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
-
-    def test_404_not_found_error(self):
-        def handler(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(
-                404,
-                json={"type": "error", "error": {"type": "not_found_error", "message": "Model not found"}},
-            )
-
-        adapter = _make_adapter(handler)
-        with pytest.raises(NotFoundError):
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
+        assert exc_info.value.retryable is retryable
+        assert exc_info.value.retry_after == retry_after
 
     def test_timeout_error(self):
         def handler(request: httpx.Request) -> httpx.Response:
@@ -792,7 +746,7 @@ class TestAnthropicErrorHandling:
         adapter = _make_adapter(handler)
         from unified_llm.errors import RequestTimeoutError as RTE
         with pytest.raises(RTE):
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
+            adapter.complete(_REQ_HI)
 
     def test_network_error(self):
         def handler(request: httpx.Request) -> httpx.Response:
@@ -801,7 +755,7 @@ class TestAnthropicErrorHandling:
         adapter = _make_adapter(handler)
         from unified_llm.errors import NetworkError as NE
         with pytest.raises(NE):
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
+            adapter.complete(_REQ_HI)
 
     def test_error_code_preserved(self):
         def handler(request: httpx.Request) -> httpx.Response:
@@ -812,7 +766,7 @@ class TestAnthropicErrorHandling:
 
         adapter = _make_adapter(handler)
         with pytest.raises(AuthenticationError) as exc_info:
-            adapter.complete(Request(model="m", messages=(Message.user("Hi"),)))
+            adapter.complete(_REQ_HI)
         assert exc_info.value.error_code == "authentication_error"
 
 
@@ -868,23 +822,19 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
+        events = list(adapter.stream(_REQ_HI))
 
-        event_types = [e.type for e in events]
-        assert StreamEventType.STREAM_START in event_types
-        assert StreamEventType.TEXT_START in event_types
-        assert StreamEventType.TEXT_DELTA in event_types
-        assert StreamEventType.TEXT_END in event_types
-        assert StreamEventType.FINISH in event_types
+        grouped = _collect(events)
+        assert grouped[StreamEventType.STREAM_START]
+        assert grouped[StreamEventType.TEXT_START]
+        assert grouped[StreamEventType.TEXT_END]
 
         # Check text deltas
-        text_deltas = [e.delta for e in events if e.type == StreamEventType.TEXT_DELTA]
-        assert "".join(text_deltas) == "Hello world"
+        text_deltas = grouped[StreamEventType.TEXT_DELTA]
+        assert "".join(e.delta for e in text_deltas) == "Hello world"
 
         # Check finish event
-        finish = [e for e in events if e.type == StreamEventType.FINISH][0]
+        finish = grouped[StreamEventType.FINISH][0]
         assert finish.finish_reason.reason == FinishReason.STOP
         assert finish.usage.output_tokens == 5
 
@@ -937,13 +887,12 @@ class TestAnthropicStreaming:
             Request(model="claude-opus-4-6", messages=(Message.user("Weather"),))
         ))
 
-        event_types = [e.type for e in events]
-        assert StreamEventType.TOOL_CALL_START in event_types
-        assert StreamEventType.TOOL_CALL_DELTA in event_types
-        assert StreamEventType.TOOL_CALL_END in event_types
+        grouped = _collect(events)
+        assert grouped[StreamEventType.TOOL_CALL_START]
+        assert grouped[StreamEventType.TOOL_CALL_DELTA]
 
         # Check tool call end has assembled arguments
-        tc_end = [e for e in events if e.type == StreamEventType.TOOL_CALL_END][0]
+        tc_end = grouped[StreamEventType.TOOL_CALL_END][0]
         assert tc_end.tool_call.name == "get_weather"
         assert tc_end.tool_call.arguments == {"city": "NYC"}
 
@@ -1002,17 +951,13 @@ class TestAnthropicStreaming:
             Request(model="claude-opus-4-6", messages=(Message.user("Think"),))
         ))
 
-        event_types = [e.type for e in events]
-        assert StreamEventType.REASONING_START in event_types
-        assert StreamEventType.REASONING_DELTA in event_types
-        assert StreamEventType.REASONING_END in event_types
+        grouped = _collect(events)
+        assert grouped[StreamEventType.REASONING_START]
+        assert grouped[StreamEventType.REASONING_END]
 
         # Check reasoning delta
-        reasoning_deltas = [
-            e.reasoning_delta for e in events
-            if e.type == StreamEventType.REASONING_DELTA
-        ]
-        assert "".join(d for d in reasoning_deltas if d) == "Let me think"
+        reasoning_deltas = grouped[StreamEventType.REASONING_DELTA]
+        assert "".join(e.reasoning_delta or "" for e in reasoning_deltas) == "Let me think"
 
     def test_finish_event_contains_response(self):
         """The FINISH event should contain a response with usage and model info."""
@@ -1054,11 +999,7 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
-
-        finish = [e for e in events if e.type == StreamEventType.FINISH][0]
+        finish = first_of(adapter.stream(_REQ_HI), StreamEventType.FINISH)
         assert finish.response is not None
         assert finish.response.id == "msg_4"
         assert finish.response.model == "claude-opus-4-6"
@@ -1088,7 +1029,7 @@ class TestAnthropicStreaming:
         ])
 
         def handler(request: httpx.Request) -> httpx.Response:
-            captured["body"] = json.loads(request.content)
+            captured["body"] = _loads(request.content)
             return httpx.Response(
                 200,
                 content=sse_text.encode(),
@@ -1096,9 +1037,7 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
+        list(adapter.stream(_REQ_HI))
         assert captured["body"]["stream"] is True
 
     def test_stream_error_event(self):
@@ -1128,9 +1067,7 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
+        events = list(adapter.stream(_REQ_HI))
 
         error_events = [e for e in events if e.type == StreamEventType.ERROR]
         assert len(error_events) == 1
@@ -1145,9 +1082,7 @@ class TestAnthropicStreaming:
 
         adapter = _make_adapter(handler)
         with pytest.raises(RateLimitError):
-            list(adapter.stream(
-                Request(model="m", messages=(Message.user("Hi"),))
-            ))
+            list(adapter.stream(_REQ_HI))
 
     def test_multiple_text_blocks_streaming(self):
         """Multiple text blocks should each get TEXT_START/TEXT_END events."""
@@ -1200,14 +1135,11 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
+        events = list(adapter.stream(_REQ_HI))
 
-        text_starts = [e for e in events if e.type == StreamEventType.TEXT_START]
-        text_ends = [e for e in events if e.type == StreamEventType.TEXT_END]
-        assert len(text_starts) == 2
-        assert len(text_ends) == 2
+        grouped = _collect(events)
+        assert len(grouped[StreamEventType.TEXT_START]) == 2
+        assert len(grouped[StreamEventType.TEXT_END]) == 2
 
     def test_text_id_in_stream_events(self):
         """Text events should include text_id for multi-block tracking."""
@@ -1249,11 +1181,7 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
-
-        text_delta = [e for e in events if e.type == StreamEventType.TEXT_DELTA][0]
+        text_delta = first_of(adapter.stream(_REQ_HI), StreamEventType.TEXT_DELTA)
         assert text_delta.text_id == "2"
 
     def test_ping_events_ignored(self):
@@ -1288,14 +1216,68 @@ class TestAnthropicStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="claude-opus-4-6", messages=(Message.user("Hi"),))
-        ))
+        events = list(adapter.stream(_REQ_HI))
 
         # Should not have any ping-related events
         event_types = [e.type for e in events]
         assert StreamEventType.STREAM_START in event_types
 
+    def test_events_split_across_chunks(self):
+        """SSE events must parse the same however the body is chunked."""
+        sse_bytes = _sse_lines([
+            ("message_start", {
+                "type": "message_start",
+                "message": {
+                    "id": "msg_c",
+                    "model": "claude-opus-4-6",
+                    "usage": {"input_tokens": 3, "output_tokens": 0},
+                },
+            }),
+            ("content_block_start", {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            }),
+            ("content_block_delta", {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": "Hello"},
+            }),
+            ("content_block_delta", {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": " there"},
+            }),
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_stop", {"type": "message_stop"}),
+        ]).encode()
+        # Several whole events in the first chunk, then a split mid-line and
+        # a split between the two newlines that end an event.
+        first_delta = sse_bytes.index(b"event: content_block_delta")
+        mid_line = first_delta + 30
+        between_newlines = sse_bytes.index(b"\n\n", mid_line) + 1
+        chunks = [
+            sse_bytes[:first_delta],
+            sse_bytes[first_delta:mid_line],
+            sse_bytes[mid_line:between_newlines],
+            sse_bytes[between_newlines:],
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                stream=_ChunkedBytes(chunks),
+                headers={"content-type": "text/event-stream"},
+            )
+
+        adapter = _make_adapter(handler)
+        grouped = _collect(list(adapter.stream(_REQ_HI)))
+
+        deltas = grouped[StreamEventType.TEXT_DELTA]
+        assert [e.delta for e in deltas] == ["Hello", " there"]
+        assert len(grouped[StreamEventType.TEXT_END]) == 1
+        assert len(grouped[StreamEventType.FINISH]) == 1
+
 
 # ===========================================================================
 # Adapter Properties
@@ -8,6 +8,7 @@ from unittest.mock import patch
 import httpx
 import pytest
 
+from tests.test_unified_llm.providers.conftest import first_of, share_mock_client
 from unified_llm.errors import (
     AuthenticationError,
     InvalidRequestError,
@@ -27,7 +28,6 @@ from unified_llm.types.enums import (
 from unified_llm.types.messages import Message
 from unified_llm.types.request import Request
 from unified_llm.types.response import FinishReasonInfo, Response, Usage
-from unified_llm.types.streaming import StreamEvent
 from unified_llm.types.tools import Tool, ToolCall, ToolChoice
 
 
@@ -35,16 +35,11 @@ from unified_llm.types.tools import Tool, ToolCall, ToolChoice
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _make_adapter(handler) -> GeminiAdapter:
-    """Create an adapter wired to a mock transport."""
-    adapter = GeminiAdapter(api_key="test-key")
-    adapter._client = httpx.Client(
-        transport=httpx.MockTransport(handler),
-        base_url="https://generativelanguage.googleapis.com",
-        headers={"content-type": "application/json"},
-        timeout=httpx.Timeout(120.0),
-    )
-    return adapter
+_make_adapter = share_mock_client(
+    GeminiAdapter(api_key="test-key"),
+    base_url="https://generativelanguage.googleapis.com",
+    headers={"content-type": "application/json"},
+)
 
 
 def _simple_response(**overrides: Any) -> dict[str, Any]:
@@ -70,11 +65,9 @@ def _simple_response(**overrides: Any) -> dict[str, Any]:
 
 def _sse_lines(data_objects: list[dict[str, Any]]) -> str:
     """Build SSE text from a list of data objects (Gemini uses data-only SSE)."""
-    lines: list[str] = []
-    for data in data_objects:
-        lines.append(f"data: {json.dumps(data)}")
-        lines.append("")
-    return "\n".join(lines)
+    return "".join(
+        f"data: {json.dumps(data, separators=(',', ':'))}\n\n" for data in data_objects
+    )
 
 
 # ===========================================================================
@@ -930,11 +923,12 @@ class TestGeminiStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="gemini-2.0-flash", messages=(Message.user("Hi"),))
-        ))
-
-        finish = [e for e in events if e.type == StreamEventType.FINISH][0]
+        finish = first_of(
+            adapter.stream(
+                Request(model="gemini-2.0-flash", messages=(Message.user("Hi"),))
+            ),
+            StreamEventType.FINISH,
+        )
         assert finish.usage.input_tokens == 20
         assert finish.usage.output_tokens == 10
 
@@ -1036,11 +1030,12 @@ class TestGeminiStreaming:
             )
 
         adapter = _make_adapter(handler)
-        events = list(adapter.stream(
-            Request(model="gemini-2.0-flash", messages=(Message.user("Hi"),))
-        ))
-
-        finish = [e for e in events if e.type == StreamEventType.FINISH][0]
+        finish = first_of(
+            adapter.stream(
+                Request(model="gemini-2.0-flash", messages=(Message.user("Hi"),))
+            ),
+            StreamEventType.FINISH,
+        )
         assert finish.response is not None
         assert finish.response.provider == "gemini"
 
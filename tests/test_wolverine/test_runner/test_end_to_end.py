@@ -584,9 +584,9 @@ class TestEventBusIntegration:
         runner.close()
 
     def test_stage_completed_events_for_each_node(self, tmp_path) -> None:
-        events_received: list = []
+        stage_events: list[StageCompleted] = []
         event_bus = EventBus()
-        event_bus.on_all(lambda e: events_received.append(e))
+        event_bus.subscribe(StageCompleted, stage_events.append)
 
         interviewer = QueueInterviewer(timeout=5.0)
         runner = _make_runner(tmp_path, interviewer=interviewer, event_bus=event_bus)
@@ -598,7 +598,6 @@ class TestEventBusIntegration:
         runner.run_pipeline(signal)
         thread.join(timeout=10.0)
 
-        stage_events = [e for e in events_received if type(e).__name__ == "StageCompleted"]
         node_ids = [e.node_id for e in stage_events]
         # The happy path visits: Start, ingest, classify, is_duplicate, diagnose,
         # heal, validate, review_gate, apply